@@ -456,6 +456,8 @@ create_launch_agent() {
     <true/>
     <key>KeepAlive</key>
     <true/>
+    <key>ProcessType</key>
+    <string>Interactive</string>
     <key>StandardOutPath</key>
     <string>$INSTALL_DIR/logs/schedule_management.out</string>
     <key>StandardErrorPath</key>
@@ -516,15 +518,28 @@ EOF
     if [[ "$OS_TYPE" == "macos" ]]; then
         cat > "$INSTALL_DIR/restart_reminders.sh" << EOF
 #!/bin/bash
+# Restart the loaded agent in place; fall back to a full reload when it is not loaded
+launchctl kickstart -k "gui/\$(id -u)/${LAUNCH_AGENT_NAME}" >/dev/null 2>&1 && exit 0
 "$INSTALL_DIR/stop_reminders.sh"
-sleep 2
+# Wait up to 2s for the agent to unload and the runner to exit
+for _ in \$(seq 40); do
+    launchctl list ${LAUNCH_AGENT_NAME} >/dev/null 2>&1 || pgrep -f "python.*reminder_macos.py" >/dev/null || break
+    sleep 0.05
+done
 launchctl load "\$HOME/Library/LaunchAgents/com.sergiudm.schedule.management.reminder.plist"
 EOF
     elif [[ "$OS_TYPE" == "linux" ]]; then
         cat > "$INSTALL_DIR/restart_reminders.sh" << EOF
 #!/bin/bash
+# Restart the running unit in place; fall back to stop + start otherwise
+systemctl --user is-active --quiet schedule-management.service \\
+    && systemctl --user restart schedule-management.service && exit 0
 "$INSTALL_DIR/stop_reminders.sh"
-sleep 2
+# Wait up to 2s for the runner to exit
+for _ in \$(seq 40); do
+    pgrep -f "python.*reminder_macos.py" >/dev/null || break
+    sleep 0.05
+done
 systemctl --user start schedule-management.service
 EOF
     fi
@@ -7,7 +7,7 @@ delegates to the various command modules.
 
 Architecture:
     cli.py (this file)
-    ├── commands/tasks.py     - add, rm, ls commands
+    ├── commands/tasks.py     - add, rm, ls, batch commands
     ├── commands/deadlines.py - ddl add, rm, show commands
     ├── commands/habits.py    - track command
     ├── commands/completion.py - shell completion script generation
@@ -50,7 +50,12 @@ from schedule_management.config_layout import (
 )
 
 # Import command handlers from organized modules
-from schedule_management.commands.tasks import add_task, delete_task, show_tasks
+from schedule_management.commands.tasks import (
+    add_task,
+    batch_tasks,
+    delete_task,
+    show_tasks,
+)
 from schedule_management.commands.deadlines import (
     add_deadline,
     delete_deadline,
@@ -62,7 +67,6 @@ from schedule_management.commands.completion import (
     completion_command,
 )
 from schedule_management.commands.status import status_command, view_command
-from schedule_management.commands.sync import sync_command
 from schedule_management.commands.service import (
     update_command,
     stop_command,
@@ -71,7 +75,25 @@ from schedule_management.commands.service import (
     edit_schedule_command,
     mode_command,
 )
-from schedule_management.commands.setup import setup_command
+
+
+# =============================================================================
+# LAZY COMMAND HANDLERS
+# =============================================================================
+
+
+def sync_command(args) -> int:
+    """Run `rmd sync`, importing the LLM-backed sync stack only when used."""
+    from schedule_management.commands.sync import sync_command as handler
+
+    return handler(args)
+
+
+def setup_command(args) -> int:
+    """Run `rmd setup`, importing the LLM-backed setup agent only when used."""
+    from schedule_management.commands.setup import setup_command as handler
+
+    return handler(args)
 
 
 # =============================================================================
@@ -79,6 +101,32 @@ from schedule_management.commands.setup import setup_command
 # =============================================================================
 
 
+def _build_help_epilog() -> str:
+    """Build the colored help epilog showing where configuration is read from."""
+    # Resolve config directories at runtime so test fixtures and env overrides apply.
+    config_root_dir = resolve_config_root_dir()
+    active_config_dir = preview_active_config_dir(config_root_dir)
+
+    return f"""
+{COLORS["UNDERLINE"]}{COLORS["YELLOW"]}{_t('Configuration root:')}{COLORS["RESET"]} {COLORS["BLUE"]}{config_root_dir}{COLORS["RESET"]}
+{COLORS["UNDERLINE"]}{COLORS["YELLOW"]}{_t('Active config:')}{COLORS["RESET"]} {COLORS["BLUE"]}{active_config_dir}{COLORS["RESET"]}
+    """
+
+
+class _HelpEpilogParser(argparse.ArgumentParser):
+    """
+    Top-level parser that builds its epilog only when help is rendered.
+
+    Locating the active config set scans the config root, which ordinary
+    command invocations never need.
+    """
+
+    def format_help(self) -> str:
+        if self.epilog is None:
+            self.epilog = _build_help_epilog()
+        return super().format_help()
+
+
 def create_parser() -> argparse.ArgumentParser:
     """
     Create and configure the argument parser for the CLI.
@@ -91,13 +139,14 @@ def create_parser() -> argparse.ArgumentParser:
         ├── add <task> <priority>       - Add new task
         ├── rm <tasks...>               - Remove tasks
         ├── ls                          - List tasks
+        ├── batch [file]                - Apply add/rm operations in one pass
         ├── ddl                         - Deadline management
         │   ├── add <event> <date>      - Add deadline
         │   └── rm <events...>          - Remove deadlines
         ├── track [habit_ids...]        - Track habits
         ├── status [-v]                 - Show current status
         ├── sync                        - Assign today's work blocks to tasks
-        ├── view                        - Generate PDF visualization
+        ├── view [--force]              - Generate PDF visualization
         ├── update                      - Update config from git
         ├── switch <config_id>          - Switch active config snapshot
         ├── stop                        - Stop reminder service
@@ -106,27 +155,17 @@ def create_parser() -> argparse.ArgumentParser:
         ├── completion [shell]          - Print shell completion script
         └── setup                       - Interactive schedule setup
     """
-    # Resolve config directories at runtime so test fixtures and env overrides apply.
-    config_root_dir = resolve_config_root_dir()
-    active_config_dir = preview_active_config_dir(config_root_dir)
-
     # Build colored help text
     colored_description = (
         f"{COLORS['BOLD']}{COLORS['CYAN']}{_t('rmd CLI')}{COLORS['RESET']} - "
         f"{COLORS['GREEN']}{_t('Manage your schedule management system')}{COLORS['RESET']}"
     )
 
-    colored_epilog = f"""
-{COLORS["UNDERLINE"]}{COLORS["YELLOW"]}{_t('Configuration root:')}{COLORS["RESET"]} {COLORS["BLUE"]}{config_root_dir}{COLORS["RESET"]}
-{COLORS["UNDERLINE"]}{COLORS["YELLOW"]}{_t('Active config:')}{COLORS["RESET"]} {COLORS["BLUE"]}{active_config_dir}{COLORS["RESET"]}
-    """
-
-    # Create main parser
-    parser = argparse.ArgumentParser(
+    # Create main parser; the config-location epilog is filled in on demand
+    parser = _HelpEpilogParser(
         prog="rmd",
         description=colored_description,
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=colored_epilog,
     )
 
     # Create subparsers container
@@ -187,6 +226,26 @@ def create_parser() -> argparse.ArgumentParser:
     )
     show_parser.set_defaults(func=show_tasks)
 
+    # batch - Apply many add/rm operations with one load and save
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="Apply add/rm operations from a JSON Lines file (or stdin) in one pass",
+        description=(
+            "Apply task operations such as "
+            '{"op": "add", "task": "Study", "priority": 8} or '
+            '{"op": "rm", "task": "Study"}, one JSON object per line, '
+            "loading and saving the task list only once."
+        ),
+    )
+    batch_parser.add_argument(
+        "file",
+        nargs="?",
+        default="-",
+        type=argparse.FileType("r", encoding="utf-8"),
+        help="JSON Lines file of operations (default: read stdin)",
+    )
+    batch_parser.set_defaults(func=batch_tasks)
+
     # -------------------------------------------------------------------------
     # Deadline Management Commands
     # -------------------------------------------------------------------------
@@ -275,6 +334,11 @@ def create_parser() -> argparse.ArgumentParser:
         help="Generate schedule visualizations",
         description="Create a multi-page PDF visualization of your schedules.",
     )
+    view_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-render even if the PDF is newer than your schedule files",
+    )
     view_parser.set_defaults(func=view_command)
 
     # sync - Generate task assignments for today's work blocks
@@ -416,6 +480,29 @@ def create_parser() -> argparse.ArgumentParser:
 # =============================================================================
 
 
+def _fast_path_args(argv: list[str]) -> argparse.Namespace | None:
+    """
+    Parse the most frequent argument-free invocations without argparse.
+
+    Building the full parser costs a few milliseconds per run. `rmd ls` and
+    `rmd status [-v]` take no values, so their namespaces are built directly;
+    everything else (including help and errors) goes through create_parser().
+
+    Args:
+        argv: Command-line arguments without the program name
+
+    Returns:
+        The namespace create_parser() would produce, or None to fall back
+    """
+    if argv == ["ls"]:
+        return argparse.Namespace(command="ls", func=show_tasks)
+    if argv and argv[0] == "status" and all(arg in ("-v", "--verbose") for arg in argv[1:]):
+        return argparse.Namespace(
+            command="status", verbose=len(argv) > 1, func=status_command
+        )
+    return None
+
+
 def main() -> int:
     """
     Main entry point for the rmd CLI.
@@ -439,13 +526,15 @@ def main() -> int:
         # Displays help text
         1
     """
-    parser = create_parser()
-    args = parser.parse_args()
-
-    # Show help if no command provided
-    if not args.command:
-        parser.print_help()
-        return 1
+    args = _fast_path_args(sys.argv[1:])
+    if args is None:
+        parser = create_parser()
+        args = parser.parse_args()
+
+        # Show help if no command provided
+        if not args.command:
+            parser.print_help()
+            return 1
 
     # Execute the command handler
     try:
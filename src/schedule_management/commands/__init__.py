@@ -2,7 +2,7 @@
 Commands Package - CLI command handlers for the schedule management system.
 
 This package contains all CLI command implementations, organized by domain:
-- tasks: Task management (add, delete, list)
+- tasks: Task management (add, delete, list, batch)
 - deadlines: Deadline management (add, delete, show)
 - habits: Habit tracking commands
 - completion: Shell completion script generation
@@ -12,30 +12,48 @@ This package contains all CLI command implementations, organized by domain:
 - setup: Interactive AI-assisted schedule setup
 """
 
-from schedule_management.commands.tasks import add_task, delete_task, show_tasks
-from schedule_management.commands.deadlines import (
-    add_deadline,
-    delete_deadline,
-    show_deadlines,
-)
-from schedule_management.commands.habits import track_habits
-from schedule_management.commands.completion import completion_command
-from schedule_management.commands.status import status_command, view_command
-from schedule_management.commands.sync import sync_command
-from schedule_management.commands.service import (
-    update_command,
-    stop_command,
-    switch_command,
-    report_command,
-    edit_schedule_command,
-    mode_command,
-)
-from schedule_management.commands.setup import setup_command
+from importlib import import_module
+
+# Handlers are imported on first access so that importing one command module
+# (e.g. for `rmd ls`) does not drag in every sibling, notably the LLM-backed
+# setup/sync stack.
+_HANDLER_MODULES = {
+    "add_task": "tasks",
+    "delete_task": "tasks",
+    "batch_tasks": "tasks",
+    "show_tasks": "tasks",
+    "add_deadline": "deadlines",
+    "delete_deadline": "deadlines",
+    "show_deadlines": "deadlines",
+    "track_habits": "habits",
+    "completion_command": "completion",
+    "status_command": "status",
+    "view_command": "status",
+    "sync_command": "sync",
+    "update_command": "service",
+    "stop_command": "service",
+    "switch_command": "service",
+    "report_command": "service",
+    "edit_schedule_command": "service",
+    "mode_command": "service",
+    "setup_command": "setup",
+}
+
+
+def __getattr__(name: str):
+    module_name = _HANDLER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    handler = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = handler
+    return handler
+
 
 __all__ = [
     # Task commands
     "add_task",
     "delete_task",
+    "batch_tasks",
     "show_tasks",
     # Deadline commands
     "add_deadline",
@@ -16,6 +16,7 @@ Example Usage (via CLI):
 """
 
 import sys
+from collections import Counter
 from datetime import date, datetime, timezone
 from typing import Any
 from schedule_management.i18n import _t
@@ -296,24 +297,25 @@ def delete_deadline(args) -> int:
         print(_t("⚠️  No deadlines found to delete"))
         return 1
 
+    # Count deadlines per event once so each identifier is a lookup
+    counts_by_event = Counter(ddl["event"] for ddl in deadlines)
+    deleted_events: set[str] = set()
+
     total_deleted_count = 0
     all_errors = []
     successful_deletions = []
 
     for event_identifier in event_identifiers:
         event_name = event_identifier
-        original_count = len(deadlines)
-
-        # Find and remove matching deadlines
-        deleted_deadlines = [ddl for ddl in deadlines if ddl["event"] == event_name]
-        deadlines = [ddl for ddl in deadlines if ddl["event"] != event_name]
 
-        if len(deadlines) == original_count:
+        # Claim every deadline with this name; a repeat finds nothing
+        deleted_count = counts_by_event.pop(event_name, 0)
+        if not deleted_count:
             error_msg = _t("❌ Deadline '{event}' not found").format(event=event_name)
             all_errors.append(error_msg)
             continue
 
-        deleted_count = original_count - len(deadlines)
+        deleted_events.add(event_name)
         total_deleted_count += deleted_count
 
         if deleted_count == 1:
@@ -330,6 +332,7 @@ def delete_deadline(args) -> int:
         print(error)
 
     if successful_deletions:
+        deadlines = [ddl for ddl in deadlines if ddl["event"] not in deleted_events]
         try:
             save_deadlines(deadlines)
             if len(successful_deletions) == 1:
@@ -26,7 +26,7 @@ from schedule_management.data import (
     load_habit_records,
     save_habit_records,
 )
-from schedule_management.platform import choose_multiple, ask_yes_no
+from schedule_management.platform import ask_yes_no
 
 
 # =============================================================================
@@ -18,6 +18,7 @@ Example Usage (via CLI):
 """
 
 import os
+import shutil
 import signal
 import subprocess
 import sys
@@ -471,12 +472,9 @@ def edit_schedule_command(args) -> int:
     if not editor:
         # Try common editors
         for candidate in ["code", "vim", "nano", "vi"]:
-            try:
-                subprocess.run(["which", candidate], capture_output=True, check=True)
+            if shutil.which(candidate):
                 editor = candidate
                 break
-            except subprocess.CalledProcessError:
-                continue
 
     if not editor:
         print(_t("❌ No editor found. Set $EDITOR environment variable."))
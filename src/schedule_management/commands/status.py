@@ -14,9 +14,12 @@ Example Usage (via CLI):
     $ rmd view            # Generate schedule PDF
 """
 
+import os
 import subprocess
 import sys
-from datetime import date, datetime, timedelta
+from bisect import bisect_right
+from datetime import date, datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
@@ -33,12 +36,13 @@ except ImportError:
 from schedule_management import SETTINGS_PATH, ODD_PATH, EVEN_PATH
 from schedule_management.i18n import _t
 from schedule_management.config import ScheduleConfig, WeeklySchedule
+from schedule_management.config_layout import ACTIVE_CONFIG_MARKER, resolve_config_root_dir
 from schedule_management.synced_schedule import (
     apply_synced_schedule,
     format_event_label,
     get_event_block_name,
 )
-from schedule_management.time_utils import get_week_parity, parse_time
+from schedule_management.time_utils import get_week_parity, parse_time, weekday_name
 from schedule_management.data.loaders import load_mode
 
 
@@ -63,13 +67,14 @@ def get_today_schedule_for_status(
     config = ScheduleConfig(SETTINGS_PATH)
     weekly = WeeklySchedule(ODD_PATH, EVEN_PATH)
     is_skipped = config.should_skip_today()
-    parity = get_week_parity()
+    today = date.today()
+    parity = get_week_parity(today)
     schedule = {} if is_skipped else weekly.get_today_schedule(config)
     if apply_sync and schedule:
-        weekday = date.today().strftime("%A").lower()
+        weekday = weekday_name(today)
         schedule = apply_synced_schedule(
             schedule,
-            target_date=date.today(),
+            target_date=today,
             parity=parity,
             weekday=weekday,
         )
@@ -77,9 +82,31 @@ def get_today_schedule_for_status(
     return schedule, parity, is_skipped, config
 
 
+def _sorted_schedule_times(schedule: dict[str, Any]) -> list[tuple[int, str]]:
+    """
+    Parse a schedule's time keys into (seconds since midnight, key) pairs.
+
+    Keys that are not valid times are skipped; the result is sorted by time.
+    """
+    scheduled_times: list[tuple[int, str]] = []
+    for time_str in schedule.keys():
+        try:
+            scheduled_time = parse_time(time_str)
+        except ValueError:
+            continue
+        scheduled_times.append(
+            (scheduled_time.hour * 3600 + scheduled_time.minute * 60, time_str)
+        )
+
+    scheduled_times.sort()
+    return scheduled_times
+
+
 def get_current_and_next_events(
     schedule: dict[str, Any],
     config: ScheduleConfig | None = None,
+    scheduled_times: list[tuple[int, str]] | None = None,
+    now: datetime | None = None,
 ) -> tuple[str | None, str | None, str | None]:
     """
     Get current and next scheduled events from today's schedule.
@@ -91,6 +118,9 @@ def get_current_and_next_events(
     Args:
         schedule: Today's schedule dict (time -> event)
         config: Optional ScheduleConfig for duration lookup
+        scheduled_times: Optional result of ``_sorted_schedule_times(schedule)``
+            when the caller has already parsed the schedule
+        now: Optional current time, so a caller can read the clock once
 
     Returns:
         Tuple of (current_event, next_event, time_to_next)
@@ -105,10 +135,13 @@ def get_current_and_next_events(
     if not schedule:
         return None, None, None
 
-    now = datetime.now()
-    current_time = now.time()
-    today = date.today()
-    now_dt = datetime.combine(today, current_time)
+    current_time = (now or datetime.now()).time()
+    now_seconds = (
+        current_time.hour * 3600
+        + current_time.minute * 60
+        + current_time.second
+        + current_time.microsecond / 1_000_000
+    )
 
     def get_event_duration_minutes(event: Any) -> int:
         """Get event duration in minutes."""
@@ -128,46 +161,37 @@ def get_current_and_next_events(
 
         return 1
 
-    # Parse and sort scheduled times
-    scheduled_times: list[tuple[str, datetime]] = []
-    for time_str in schedule.keys():
-        try:
-            scheduled_time = parse_time(time_str)
-            scheduled_times.append((time_str, datetime.combine(today, scheduled_time)))
-        except ValueError:
-            continue
-
-    scheduled_times.sort(key=lambda x: x[1])
+    if scheduled_times is None:
+        scheduled_times = _sorted_schedule_times(schedule)
 
     current_event = None
     next_event = None
     time_to_next = None
 
-    for time_str, start_dt in scheduled_times:
-        event = schedule[time_str]
-
-        event_name = format_event_label(event)
-        duration_minutes = get_event_duration_minutes(event)
-        end_dt = start_dt + timedelta(minutes=duration_minutes)
-
-        # Check if this event is currently active
-        if start_dt <= now_dt < end_dt:
-            current_event = _t("{event} at {time}").format(event=event_name, time=time_str)
+    # Events starting at or before now sit left of the split; the first one
+    # right of it is the next event.
+    split = bisect_right(scheduled_times, now_seconds, key=itemgetter(0))
 
-        # Check if this is the next upcoming event
-        if start_dt > now_dt and next_event is None:
-            next_event = _t("{event} at {time}").format(event=event_name, time=time_str)
+    if split < len(scheduled_times):
+        start_seconds, time_str = scheduled_times[split]
+        event_name = format_event_label(schedule[time_str])
+        next_event = _t("{event} at {time}").format(event=event_name, time=time_str)
 
-            # Calculate time until next event
-            diff = start_dt - now_dt
-            total_minutes = int(diff.total_seconds() // 60)
-            hours = total_minutes // 60
-            minutes = total_minutes % 60
+        # Calculate time until next event
+        hours, minutes = divmod(int((start_seconds - now_seconds) // 60), 60)
+        if hours > 0:
+            time_to_next = _t("{hours}h {minutes}m").format(hours=hours, minutes=minutes)
+        else:
+            time_to_next = _t("{minutes}m").format(minutes=minutes)
 
-            if hours > 0:
-                time_to_next = _t("{hours}h {minutes}m").format(hours=hours, minutes=minutes)
-            else:
-                time_to_next = _t("{minutes}m").format(minutes=minutes)
+    # The most recently started event that is still running is the current one
+    for start_seconds, time_str in reversed(scheduled_times[:split]):
+        event = schedule[time_str]
+        end_seconds = start_seconds + get_event_duration_minutes(event) * 60
+        if now_seconds < end_seconds:
+            event_name = format_event_label(event)
+            current_event = _t("{event} at {time}").format(event=event_name, time=time_str)
+            break
 
     return current_event, next_event, time_to_next
 
@@ -176,6 +200,30 @@ def get_current_and_next_events(
 # STATUS COMMAND
 # =============================================================================
 
+# (block name keyword, style, icon) for verbose schedule rows; first match wins
+_ACTIVITY_STYLES = (
+    ("pomodoro", "bold red", "🍅"),
+    ("potato", "bold yellow", "🥔"),
+    ("go_to_bed", "bold blue", "🌙"),
+    ("summary_time", "bold magenta", "📝"),
+)
+
+
+def _format_activity_cell(name: str, block_name: str) -> str:
+    """Build the styled activity cell for a verbose schedule row."""
+    block_name_lower = block_name.lower()
+    if (
+        "break" in block_name_lower
+        or "napping" in block_name_lower
+        or "break" in name.lower()
+    ):
+        return f"☕  [italic dim]{name}[/italic dim]"
+
+    for keyword, style, icon in _ACTIVITY_STYLES:
+        if keyword in block_name_lower:
+            return f"{icon}  [{style}]{name}[/{style}]"
+    return f"•  [bold]{name}[/bold]"
+
 
 def _schedule_visualizer_class():
     from schedule_management.visualizer import ScheduleVisualizer
@@ -216,155 +264,137 @@ def status_command(args) -> int:
 
     console = Console()
 
-    try:
-        schedule, parity, is_skipped, config = get_today_schedule_for_status()
-
-        # Header: Week parity
-        parity_display = _t("Odd") if parity == "odd" else _t("Even")
-        parity_text = _t("📅 {parity} Week").format(parity=parity_display)
-        parity_style = "bold magenta" if parity == "odd" else "bold cyan"
-        console.print(Align.center(f"[{parity_style}]{parity_text}[/{parity_style}]"))
-
-        # Handle skip days
-        if is_skipped:
-            console.print(
-                Panel(
-                    Align.center(_t("⏭️  Today is a skipped day - enjoy your time off!")),
-                    style="yellow",
-                    box=box.ROUNDED,
+    # Buffer the whole report; rich writes it to the terminal once on exit
+    with console:
+        try:
+            schedule, parity, is_skipped, config = get_today_schedule_for_status()
+
+            # Header: Week parity
+            parity_display = _t("Odd") if parity == "odd" else _t("Even")
+            parity_text = _t("📅 {parity} Week").format(parity=parity_display)
+            parity_style = "bold magenta" if parity == "odd" else "bold cyan"
+            console.print(Align.center(f"[{parity_style}]{parity_text}[/{parity_style}]"))
+
+            # Handle skip days
+            if is_skipped:
+                console.print(
+                    Panel(
+                        Align.center(_t("⏭️  Today is a skipped day - enjoy your time off!")),
+                        style="yellow",
+                        box=box.ROUNDED,
+                    )
                 )
+                return 0
+
+            # Get current and next events
+            # Parsed once and shared with the verbose schedule table below
+            scheduled_times = _sorted_schedule_times(schedule)
+            current_event, next_ev, time_until = get_current_and_next_events(
+                schedule, config, scheduled_times, now=datetime.now()
             )
-            return 0
 
-        # Get current and next events
-        current_event, next_ev, time_until = get_current_and_next_events(
-            schedule, config
-        )
+            # Build status content
+            status_lines = []
 
-        # Build status content
-        status_lines = []
+            if current_event:
+                status_lines.append(_t("[bold green]🔔 NOW:[/bold green]  {event}").format(event=current_event))
+            else:
+                status_lines.append(_t("[bold yellow]🟡 IDLE[/bold yellow]"))
 
-        if current_event:
-            status_lines.append(_t("[bold green]🔔 NOW:[/bold green]  {event}").format(event=current_event))
-        else:
-            status_lines.append(_t("[bold yellow]🟡 IDLE[/bold yellow]"))
+            status_lines.append("")  # Spacer
 
-        status_lines.append("")  # Spacer
+            if next_ev:
+                time_str = _t(" (in {time_until})").format(time_until=time_until) if time_until else ""
+                status_lines.append(
+                    _t("[bold blue]⏰ NEXT:[/bold blue] {event}{time_str}").format(event=next_ev, time_str=time_str)
+                )
+            else:
+                status_lines.append(_t("[dim]📭 No upcoming events[/dim]"))
 
-        if next_ev:
-            time_str = _t(" (in {time_until})").format(time_until=time_until) if time_until else ""
-            status_lines.append(
-                _t("[bold blue]⏰ NEXT:[/bold blue] {event}{time_str}").format(event=next_ev, time_str=time_str)
-            )
-        else:
-            status_lines.append(_t("[dim]📭 No upcoming events[/dim]"))
-
-        # Show status panel
-        status_content = "\n".join(status_lines)
-        console.print(
-            Panel(
-                status_content,
-                title="[bold]" + _t("Status") + "[/bold]",
-                expand=False,
-                border_style="green" if current_event else "dim",
-                box=box.ROUNDED,
-                padding=(1, 2),
+            # Show status panel
+            status_content = "\n".join(status_lines)
+            console.print(
+                Panel(
+                    status_content,
+                    title="[bold]" + _t("Status") + "[/bold]",
+                    expand=False,
+                    border_style="green" if current_event else "dim",
+                    box=box.ROUNDED,
+                    padding=(1, 2),
+                )
             )
-        )
 
-        # Verbose: show full schedule
-        if args.verbose and schedule:
-            console.print()  # Spacer
+            # Verbose: show full schedule
+            if args.verbose and schedule:
+                console.print()  # Spacer
 
-            # Categorize events by time of day
-            morning_events = []
-            afternoon_events = []
-            evening_events = []
+                # Categorize events by time of day
+                morning_events = []
+                afternoon_events = []
+                evening_events = []
 
-            sorted_times = sorted(schedule.keys())
+                # Keys that are not times sort last and are shown in the evening
+                parsed_keys = {time_str for _, time_str in scheduled_times}
+                ordered_times = [(start // 3600, time_str) for start, time_str in scheduled_times]
+                ordered_times.extend(
+                    (None, time_str) for time_str in schedule if time_str not in parsed_keys
+                )
 
-            for time_str in sorted_times:
-                event = schedule[time_str]
-                name = format_event_label(event)
-                block_name = get_event_block_name(event) or name
+                for hour, time_str in ordered_times:
+                    event = schedule[time_str]
+                    name = format_event_label(event)
+                    block_name = get_event_block_name(event) or name
+                    item = (time_str, _format_activity_cell(name, block_name))
 
-                try:
-                    hour = int(time_str.split(":")[0])
-                    item = (time_str, name, block_name)
-                    if 5 <= hour < 12:
+                    if hour is None:
+                        evening_events.append(item)
+                    elif 5 <= hour < 12:
                         morning_events.append(item)
                     elif 12 <= hour < 18:
                         afternoon_events.append(item)
                     else:
                         evening_events.append(item)
-                except ValueError:
-                    evening_events.append((time_str, name, block_name))
-
-            # Build schedule table
-            table = Table(
-                box=box.SIMPLE_HEAD,
-                show_lines=False,
-                header_style="bold",
-                expand=True,
-            )
 
-            table.add_column(
-                _t("Time"), justify="right", style="cyan", width=8, no_wrap=True
-            )
-            table.add_column(_t("Activity"), justify="left")
-
-            def add_period_section(title: str, icon: str, events: list, color: str):
-                """Add a time-of-day section to the table."""
-                if events:
-                    table.add_section()
-                    table.add_row(
-                        f"[{color}]{icon}[/{color}]",
-                        f"[bold {color}]{title}[/bold {color}]",
-                    )
+                # Build schedule table
+                table = Table(
+                    box=box.SIMPLE_HEAD,
+                    show_lines=False,
+                    header_style="bold",
+                    expand=True,
+                )
 
-                    for time_str, name, block_name in events:
-                        # Style based on activity type
-                        block_name_lower = block_name.lower()
-                        if (
-                            "break" in block_name_lower
-                            or "break" in name.lower()
-                            or "napping" in block_name_lower
-                        ):
-                            name_styled = f"[italic dim]{name}[/italic dim]"
-                            icon_type = "☕"
-                        elif "pomodoro" in block_name_lower:
-                            name_styled = f"[bold red]{name}[/bold red]"
-                            icon_type = "🍅"
-                        elif "potato" in block_name_lower:
-                            name_styled = f"[bold yellow]{name}[/bold yellow]"
-                            icon_type = "🥔"
-                        elif "go_to_bed" in block_name_lower:
-                            name_styled = f"[bold blue]{name}[/bold blue]"
-                            icon_type = "🌙"
-                        elif "summary_time" in block_name_lower:
-                            name_styled = f"[bold magenta]{name}[/bold magenta]"
-                            icon_type = "📝"
-                        else:
-                            name_styled = f"[bold]{name}[/bold]"
-                            icon_type = "•"
-
-                        table.add_row(time_str, f"{icon_type}  {name_styled}")
-
-            add_period_section(_t("Morning"), "🌅", morning_events, "yellow")
-            add_period_section(_t("Afternoon"), "☀️ ", afternoon_events, "orange1")
-            add_period_section(_t("Evening"), "🌆", evening_events, "purple")
-
-            console.print(table)
-            console.print(
-                "[dim italic]" + _t("Total events: {count}").format(count=len(schedule)) + "[/dim italic]",
-                justify="right",
-            )
+                table.add_column(
+                    _t("Time"), justify="right", style="cyan", width=8, no_wrap=True
+                )
+                table.add_column(_t("Activity"), justify="left")
+
+                def add_period_section(title: str, icon: str, events: list, color: str):
+                    """Add a time-of-day section to the table."""
+                    if events:
+                        table.add_section()
+                        table.add_row(
+                            f"[{color}]{icon}[/{color}]",
+                            f"[bold {color}]{title}[/bold {color}]",
+                        )
+
+                        for time_str, activity in events:
+                            table.add_row(time_str, activity)
+
+                add_period_section(_t("Morning"), "🌅", morning_events, "yellow")
+                add_period_section(_t("Afternoon"), "☀️ ", afternoon_events, "orange1")
+                add_period_section(_t("Evening"), "🌆", evening_events, "purple")
+
+                console.print(table)
+                console.print(
+                    "[dim italic]" + _t("Total events: {count}").format(count=len(schedule)) + "[/dim italic]",
+                    justify="right",
+                )
 
-        return 0
+            return 0
 
-    except Exception as e:
-        console.print(_t("[bold red]❌ Error checking status:[/bold red] {e}").format(e=e))
-        return 1
+        except Exception as e:
+            console.print(_t("[bold red]❌ Error checking status:[/bold red] {e}").format(e=e))
+            return 1
 
 
 # =============================================================================
@@ -372,6 +402,32 @@ def status_command(args) -> int:
 # =============================================================================
 
 
+# Written to the Desktop by ScheduleVisualizer.visualize()
+_VISUALIZATION_PDF_NAME = "schedule_visualization.pdf"
+
+
+def _visualization_is_current(pdf_path: Path) -> bool:
+    """
+    Check whether the rendered PDF is newer than everything it is built from.
+
+    The sources are the settings and week schedule files plus the active
+    config marker, so switching config sets also counts as a change.
+    """
+    try:
+        rendered_at = pdf_path.stat().st_mtime_ns
+        sources = [SETTINGS_PATH, ODD_PATH, EVEN_PATH]
+        newest_source = max(os.stat(path).st_mtime_ns for path in sources)
+    except OSError:
+        return False
+
+    marker_path = resolve_config_root_dir() / ACTIVE_CONFIG_MARKER
+    try:
+        newest_source = max(newest_source, marker_path.stat().st_mtime_ns)
+    except OSError:
+        pass
+    return rendered_at > newest_source
+
+
 def view_command(args) -> int:
     """
     Handle the 'view' command - generate schedule visualization PDF.
@@ -381,10 +437,12 @@ def view_command(args) -> int:
     - Even week schedule
     - Weekly statistics
 
+    Rendering is skipped when the existing PDF is newer than the settings,
+    week schedule files and active config marker, unless ``--force`` is given.
     Automatically opens the PDF on macOS.
 
     Args:
-        args: Namespace (unused, for CLI compatibility)
+        args: Namespace with optional 'force' (bool) to always re-render
 
     Returns:
         0 on success, 1 on error
@@ -399,32 +457,30 @@ def view_command(args) -> int:
         print(_t("❌ Currently in p mode. Switch back to j mode to execute this command."))
         return 1
 
-    print(_t("📊 Generating schedule visualizations..."))
+    pdf_path = Path.home() / "Desktop" / _VISUALIZATION_PDF_NAME
 
     try:
-        config = ScheduleConfig(SETTINGS_PATH)
-        weekly = WeeklySchedule(ODD_PATH, EVEN_PATH)
-        ScheduleVisualizer = _schedule_visualizer_class()
-        visualizer = ScheduleVisualizer(config, weekly.odd_data, weekly.even_data)
-        visualizer.visualize()
+        if not getattr(args, "force", False) and _visualization_is_current(pdf_path):
+            print(_t("✅ Visualization is up to date (use --force to regenerate)"))
+        else:
+            print(_t("📊 Generating schedule visualizations..."))
+            config = ScheduleConfig(SETTINGS_PATH)
+            weekly = WeeklySchedule(ODD_PATH, EVEN_PATH)
+            ScheduleVisualizer = _schedule_visualizer_class()
+            visualizer = ScheduleVisualizer(config, weekly.odd_data, weekly.even_data)
+            visualizer.visualize()
 
-        print("\n" + _t("📁 Visualization file generated:"))
+            print("\n" + _t("📁 Visualization file generated:"))
 
         # Open PDF on macOS
         if sys.platform == "darwin":
             print("\n" + _t("🖼️  Opening visualization..."))
             try:
-                import platform
-
-                if platform.system() == "Windows":
-                    desktop_path = Path.home() / "Desktop"
-                else:
-                    desktop_path = Path.home() / "Desktop"
-
-                pdf_path = desktop_path / "schedule_visualization.pdf"
-                subprocess.run(
+                # Hand the file to the viewer without waiting on `open` to exit
+                subprocess.Popen(
                     ["open", str(pdf_path)],
-                    check=False,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                 )
             except Exception as e:
                 print(_t("⚠️  Could not open file: {e}").format(e=e))
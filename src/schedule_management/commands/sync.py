@@ -38,7 +38,7 @@ from schedule_management.synced_schedule import (
     iter_syncable_slots,
     save_synced_schedule,
 )
-from schedule_management.time_utils import get_week_parity
+from schedule_management.time_utils import get_week_parity, weekday_name
 
 SYNC_SYSTEM_PROMPT = """
 You assign today's focus blocks to tasks from a todo list.
@@ -379,7 +379,7 @@ def _generate_sync_proposal_from_context(
     client = LLMClient(actual_llm_config)
     current_date = _today()
     target_date = current_date.isoformat()
-    weekday = _now().strftime("%A").lower()
+    weekday = weekday_name(_now())
     feedback_items = feedback or []
 
     user_prompt = _render_sync_user_prompt(
@@ -4,6 +4,7 @@ Task Commands - CLI commands for task management.
 This module provides CLI command handlers for managing tasks:
 - add_task: Add a new task with priority
 - delete_task: Remove one or more tasks
+- batch_tasks: Apply many add/rm operations with one load and save
 - show_tasks: Display all tasks in a formatted table
 
 Tasks are stored in a JSON file with 'description' and 'priority' fields.
@@ -14,16 +15,20 @@ Example Usage (via CLI):
     $ rmd ls                         # List all tasks
     $ rmd rm 1                       # Delete task by ID
     $ rmd rm "Study math"            # Delete task by description
+    $ rmd batch < ops.jsonl          # Apply add/rm operations in one pass
 """
 
+import json
 import sys
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 from schedule_management.i18n import _t
 
 try:
     from rich import box
     from rich.console import Console
+    from rich.style import Style
     from rich.table import Table
     from rich.text import Text
 except ImportError:
@@ -38,6 +43,8 @@ from schedule_management.data import (
     save_procrastinate_list,
     get_procrastinate_age_days,
     log_task_action,
+    log_task_actions,
+    TasksDB,
 )
 
 
@@ -79,7 +86,6 @@ def add_task(args) -> int:
             print(_t("❌ Error: Postpone days must be a non-negative integer"))
             return 1
         if postpone > 0:
-            from datetime import timedelta
             alarm_from_date = datetime.now().date() + timedelta(days=postpone)
             alarm_from = alarm_from_date.isoformat()
 
@@ -180,6 +186,13 @@ def delete_task(args) -> int:
     today = datetime.now().date()
     sorted_tasks = _sort_tasks_by_section_and_priority(tasks, today, procrastinate_list)
 
+    # Index task positions by description so each identifier is a lookup
+    positions_by_description: dict[str, list[int]] = {}
+    for index, task in enumerate(tasks):
+        positions_by_description.setdefault(task["description"], []).append(index)
+    deleted_positions: set[int] = set()
+    all_deleted_tasks: list[dict[str, Any]] = []
+
     total_deleted_count = 0
     all_errors = []
     successful_deletions = []
@@ -198,35 +211,24 @@ def delete_task(args) -> int:
                 continue
 
             # Get task by ID (1-indexed)
-            task_to_delete = sorted_tasks[task_id - 1]
-            task_description = task_to_delete["description"]
-
-            # Remove from original tasks list
-            original_count = len(tasks)
-            deleted_tasks = [t for t in tasks if t["description"] == task_description]
-            tasks = [t for t in tasks if t["description"] != task_description]
+            task_description = sorted_tasks[task_id - 1]["description"]
 
         except ValueError:
             # Treat as string description
             task_description = task_identifier
-            original_count = len(tasks)
-            deleted_tasks = [t for t in tasks if t["description"] == task_description]
-            tasks = [t for t in tasks if t["description"] != task_description]
 
-        # Check if anything was deleted
-        if len(tasks) == original_count:
+        # Claim every task with this description; a repeat finds nothing
+        positions = positions_by_description.pop(task_description, [])
+        if not positions:
             error_msg = _t("❌ Task '{task_description}' not found").format(
                 task_description=task_description
             )
             all_errors.append(error_msg)
             continue
 
-        # Log deletions
-        try:
-            for deleted_task in deleted_tasks:
-                log_task_action("deleted", deleted_task)
-        except Exception as e:
-            print(_t("⚠️  Warning: Could not log task deletion: {e}").format(e=e))
+        deleted_tasks = [tasks[position] for position in positions]
+        deleted_positions.update(positions)
+        all_deleted_tasks.extend(deleted_tasks)
 
         # Keep procrastinate list in sync with completed tasks
         for deleted_task in deleted_tasks:
@@ -235,7 +237,7 @@ def delete_task(args) -> int:
                 procrastinate_list.discard(description)
                 procrastinate_updated = True
 
-        deleted_count = original_count - len(tasks)
+        deleted_count = len(deleted_tasks)
         total_deleted_count += deleted_count
 
         if deleted_count == 1:
@@ -247,11 +249,21 @@ def delete_task(args) -> int:
                 )
             )
 
+    # Log all deletions with a single write
+    if all_deleted_tasks:
+        try:
+            log_task_actions("deleted", all_deleted_tasks)
+        except Exception as e:
+            print(_t("⚠️  Warning: Could not log task deletion: {e}").format(e=e))
+
     # Print results
     for error in all_errors:
         print(error)
 
     if successful_deletions:
+        tasks = [
+            task for index, task in enumerate(tasks) if index not in deleted_positions
+        ]
         try:
             save_tasks(tasks)
             if procrastinate_updated:
@@ -272,6 +284,133 @@ def delete_task(args) -> int:
         return 1
 
 
+# =============================================================================
+# BATCH COMMAND
+# =============================================================================
+
+
+def _parse_batch_operation(line: str) -> dict[str, Any]:
+    """
+    Validate one JSON Lines batch operation.
+
+    Returns:
+        The operation with 'op', 'task' and, for adds, 'priority' and 'alarm_from'
+
+    Raises:
+        ValueError: If the line is not a valid operation
+    """
+    try:
+        operation = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(_t("invalid JSON ({e})").format(e=e)) from e
+    if not isinstance(operation, dict):
+        raise ValueError(_t("expected a JSON object"))
+
+    op = operation.get("op")
+    description = operation.get("task")
+    if op not in ("add", "rm"):
+        raise ValueError(_t("'op' must be 'add' or 'rm'"))
+    if not isinstance(description, str) or not description.strip():
+        raise ValueError(_t("'task' must be a non-empty string"))
+    if op == "rm":
+        return {"op": op, "task": description}
+
+    priority = operation.get("priority")
+    if isinstance(priority, bool) or not isinstance(priority, int) or priority <= 0:
+        raise ValueError(_t("'priority' must be a positive integer"))
+
+    postpone = operation.get("postpone", 0)
+    if isinstance(postpone, bool) or not isinstance(postpone, int) or postpone < 0:
+        raise ValueError(_t("'postpone' must be a non-negative integer"))
+    alarm_from = None
+    if postpone > 0:
+        alarm_from = (datetime.now().date() + timedelta(days=postpone)).isoformat()
+
+    return {"op": op, "task": description, "priority": priority, "alarm_from": alarm_from}
+
+
+def batch_tasks(args) -> int:
+    """
+    Handle the 'batch' command - apply many add/rm operations in one pass.
+
+    Reads JSON Lines operations from a file (or stdin) and applies them with
+    a single load and a single save of the task list, instead of one full
+    rewrite per 'rmd add'/'rmd rm' call. All lines are validated first; if
+    any is invalid nothing is changed. Blank lines and lines starting with
+    '#' are ignored.
+
+    Args:
+        args: Namespace with 'file' (open text file of operations)
+
+    Returns:
+        0 on success, 1 on invalid input, save errors or missing tasks
+
+    Example:
+        $ printf '%s\\n' '{"op": "add", "task": "Study", "priority": 8}' \\
+              '{"op": "rm", "task": "Clean room"}' | rmd batch
+        ✅ Batch applied: 1 added, 0 updated, 1 deleted
+    """
+    operations = []
+    errors = []
+    for line_number, line in enumerate(args.file, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            operations.append(_parse_batch_operation(line))
+        except ValueError as e:
+            errors.append(_t("❌ Line {line_number}: {error}").format(line_number=line_number, error=e))
+
+    if errors:
+        for error in errors:
+            print(error)
+        print(_t("❌ No changes made"))
+        return 1
+
+    if not operations:
+        print(_t("⚠️  No operations to apply"))
+        return 0
+
+    added = updated = deleted = 0
+    deleted_descriptions: set[str] = set()
+    missing: list[str] = []
+    try:
+        with TasksDB() as db:
+            for operation in operations:
+                if operation["op"] == "add":
+                    old_priority = db.add(
+                        operation["task"], operation["priority"], operation["alarm_from"]
+                    )
+                    if old_priority is None:
+                        added += 1
+                    else:
+                        updated += 1
+                elif db.delete(operation["task"]):
+                    deleted += 1
+                    deleted_descriptions.add(operation["task"])
+                else:
+                    missing.append(operation["task"])
+            # A task re-added after its removal is still on the list
+            deleted_descriptions.difference_update(task["description"] for task in db.tasks)
+
+        # Keep procrastinate list in sync with completed tasks
+        procrastinate_list = load_procrastinate_list()
+        if procrastinate_list & deleted_descriptions:
+            save_procrastinate_list(procrastinate_list - deleted_descriptions)
+    except Exception as e:
+        print(_t("❌ Error saving tasks: {e}").format(e=e))
+        return 1
+
+    for description in missing:
+        print(_t("❌ Task '{task_description}' not found").format(task_description=description))
+    print(
+        _t("✅ Batch applied: {added} added, {updated} updated, {deleted} deleted").format(
+            added=added, updated=updated, deleted=deleted
+        )
+    )
+    return 1 if missing else 0
+
+
 # =============================================================================
 # SHOW TASKS COMMAND
 # =============================================================================
@@ -288,6 +427,33 @@ def _format_procrastination_suffix(age_days: int | None) -> str:
     return _t(" ({age_days} days overdue)").format(age_days=age_days)
 
 
+# Styles for the priority column, built once instead of parsed from markup
+_HIGH_PRIORITY_STYLE = Style(color="red")
+_MEDIUM_PRIORITY_STYLE = Style(color="yellow")
+_LOW_PRIORITY_STYLE = Style(color="blue")
+_DIM_STYLE = Style(dim=True)
+
+# (filled, empty) halves of the 10-block priority bar, indexed by filled count
+_PRIORITY_BARS = tuple(("█" * filled, "░" * (10 - filled)) for filled in range(11))
+
+
+def _format_priority_bar(priority: int) -> Text:
+    """Build the colored priority bar cell for the task list."""
+    if priority >= 8:
+        style = _HIGH_PRIORITY_STYLE
+    elif priority >= 5:
+        style = _MEDIUM_PRIORITY_STYLE
+    else:
+        style = _LOW_PRIORITY_STYLE
+
+    # Visual priority bar (max 10 blocks for layout)
+    filled, empty = _PRIORITY_BARS[max(0, min(priority, 10))]
+    text = Text(filled, style=style)
+    text.append(empty, style=style + _DIM_STYLE)
+    text.append(f" ({priority})", style=style)
+    return text
+
+
 def _format_postpone_suffix(days_left: int) -> str:
     """Format postponement remaining days for the task list."""
     if days_left <= 0:
@@ -297,6 +463,26 @@ def _format_postpone_suffix(days_left: int) -> str:
     return _t(" (coming in {days_left} days)").format(days_left=days_left)
 
 
+@lru_cache(maxsize=256)
+def _parse_alarm_from(alarm_from: str) -> date | None:
+    """Parse an ``alarm_from`` date string, returning None when malformed."""
+    try:
+        return datetime.strptime(alarm_from, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def _days_until_alarm(task: dict, today: Any) -> int:
+    """Return the days remaining until a postponed task alarms again (0 if none)."""
+    alarm_from = task.get("alarm_from")
+    if not alarm_from or not isinstance(alarm_from, str):
+        return 0
+    alarm_from_date = _parse_alarm_from(alarm_from)
+    if alarm_from_date is None:
+        return 0
+    return (alarm_from_date - today).days
+
+
 def _sort_tasks_by_section_and_priority(
     tasks: list[dict], today: Any, procrastinate_list: set[str]
 ) -> list[dict]:
@@ -307,18 +493,8 @@ def _sort_tasks_by_section_and_priority(
     3. Incoming (future postponed) tasks
     Within each section, tasks are ordered by priority (highest first).
     """
-    def get_days_left(task) -> int:
-        alarm_from = task.get("alarm_from")
-        if alarm_from:
-            try:
-                alarm_from_date = datetime.strptime(alarm_from, "%Y-%m-%d").date()
-                return (alarm_from_date - today).days
-            except Exception:
-                pass
-        return 0
-
     def task_sort_key(task):
-        days_left = get_days_left(task)
+        days_left = _days_until_alarm(task, today)
         is_postponed_future = days_left > 0
         is_procrastinated = (not is_postponed_future) and (task["description"] in procrastinate_list)
 
@@ -343,6 +519,9 @@ def show_tasks(args) -> int:
     - Visual priority bar
     - Task description
 
+    When stdout is not a terminal (piped or redirected), prints one
+    tab-separated ``ID<TAB>priority<TAB>description`` line per task instead.
+
     Args:
         args: Namespace (unused, for CLI compatibility)
 
@@ -374,6 +553,16 @@ def show_tasks(args) -> int:
     # ordered by priority descending in each section
     sorted_tasks = _sort_tasks_by_section_and_priority(tasks, today, procrastinate_list)
 
+    # Piped or redirected output gets plain tab-separated rows for scripts
+    if not console.is_terminal:
+        sys.stdout.write(
+            "".join(
+                f"{i}\t{task['priority']}\t{task['description']}\n"
+                for i, task in enumerate(sorted_tasks, 1)
+            )
+        )
+        return 0
+
     # Create table
     table = Table(
         title="[bold]" + _t("Current Task List") + "[/bold]",
@@ -389,33 +578,11 @@ def show_tasks(args) -> int:
     for i, task in enumerate(sorted_tasks, 1):
         description = task["description"]
         priority = task["priority"]
-        alarm_from = task.get("alarm_from")
-
-        postpone_suffix = ""
-        is_postponed_future = False
-        if alarm_from:
-            try:
-                alarm_from_date = datetime.strptime(alarm_from, "%Y-%m-%d").date()
-                days_left = (alarm_from_date - today).days
-                if days_left > 0:
-                    postpone_suffix = _format_postpone_suffix(days_left)
-                    is_postponed_future = True
-            except Exception:
-                pass
-
-        # Color based on priority level
-        if priority >= 8:
-            color = "red"
-        elif priority >= 5:
-            color = "yellow"
-        else:
-            color = "blue"
-
-        # Visual priority bar (max 10 blocks for layout)
-        filled = "█" * min(priority, 10)
-        empty = "░" * (10 - min(priority, 10))
+        days_left = _days_until_alarm(task, today)
+        is_postponed_future = days_left > 0
+        postpone_suffix = _format_postpone_suffix(days_left)
 
-        prio_visual = f"[{color}]{filled}[dim]{empty}[/dim] ({priority})[/{color}]"
+        prio_visual = _format_priority_bar(priority)
         if is_postponed_future:
             description_text = Text(
                 f"💤 {description}{postpone_suffix}",
@@ -435,7 +602,9 @@ def show_tasks(args) -> int:
 
         table.add_row(str(i), prio_visual, description_text)
 
-    console.print(table)
-    console.print("[dim]" + _t("Total tasks: {count}").format(count=len(tasks)) + "[/dim]", justify="right")
+    # Buffer both renders so the listing reaches the terminal in one write
+    with console:
+        console.print(table)
+        console.print("[dim]" + _t("Total tasks: {count}").format(count=len(tasks)) + "[/dim]", justify="right")
 
     return 0
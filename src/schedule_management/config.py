@@ -21,22 +21,34 @@ Example Usage:
     >>> today_schedule = weekly.get_today_schedule(config)
 """
 
+import os
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
 import tomllib
 
+from schedule_management.time_utils import get_week_parity, weekday_name
+
 
 # =============================================================================
 # TOML FILE LOADING
 # =============================================================================
 
+# Parsed TOML files keyed by absolute path: {path: ((mtime_ns, size), data)}
+_TOML_CACHE: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
 
 def load_toml_file(file_path: str) -> dict[str, Any]:
     """
     Load and parse a TOML configuration file.
 
+    Parsed results are cached per path and reused until the file's
+    modification time or size changes, so repeated loads of unchanged
+    configuration skip the read and parse. The returned dict is shared
+    between callers and must be treated as read-only.
+
     Args:
         file_path: Path to the TOML file
 
@@ -47,8 +59,18 @@ def load_toml_file(file_path: str) -> dict[str, Any]:
         FileNotFoundError: If the file doesn't exist
         tomllib.TOMLDecodeError: If the TOML syntax is invalid
     """
-    with open(file_path, "rb") as f:
-        return tomllib.load(f)
+    cache_key = os.path.abspath(os.fspath(file_path))
+    stat = os.stat(cache_key)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _TOML_CACHE.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with open(cache_key, "rb") as f:
+        data = tomllib.load(f)
+    _TOML_CACHE[cache_key] = (signature, data)
+    return data
 
 
 # =============================================================================
@@ -130,6 +152,20 @@ class ScheduleConfig:
         """
         return self.settings.get("max_alarm_duration", 300)
 
+    @property
+    def time_point_alert(self) -> str:
+        """
+        How time point reminders are delivered.
+
+        'dialog' uses the repeating modal alarm; 'notification' plays the
+        sound once and shows a non-blocking desktop notification.
+
+        Returns:
+            'dialog' or 'notification' (default: 'dialog')
+        """
+        value = str(self.settings.get("time_point_alert", "dialog")).strip().lower()
+        return "notification" if value == "notification" else "dialog"
+
     # =========================================================================
     # SKIP DAYS
     # =========================================================================
@@ -152,7 +188,7 @@ class ScheduleConfig:
         skip_days = self.settings.get("skip_days", [])
         if not skip_days:
             return False
-        current_weekday = datetime.now().strftime("%A").lower()
+        current_weekday = weekday_name(datetime.now())
         return current_weekday in skip_days
 
     # =========================================================================
@@ -246,14 +282,14 @@ class ScheduleConfig:
     @property
     def log_path(self) -> str:
         """
-        Path to task log file, with ~ expansion.
+        Path to task log file, with ~ and environment variable expansion.
 
         Returns:
             Expanded file path
         """
         log_path = self.paths.get("log_path", "~/.schedule_management/task/tasks.log")
-        if "~" in log_path or "$HOME" in log_path:
-            return Path(log_path).expanduser()
+        if "~" in log_path or "$" in log_path:
+            return Path(os.path.expandvars(log_path)).expanduser()
         return log_path
 
     @property
@@ -285,8 +321,10 @@ class WeeklySchedule:
     - Day-specific sections (monday, tuesday, etc.)
 
     Attributes:
-        odd_data: Schedule dict for odd weeks
-        even_data: Schedule dict for even weeks
+        odd_path: Path to the odd weeks TOML file
+        even_path: Path to the even weeks TOML file
+        odd_data: Schedule dict for odd weeks (loaded on first access)
+        even_data: Schedule dict for even weeks (loaded on first access)
 
     Example:
         >>> weekly = WeeklySchedule('odd_weeks.toml', 'even_weeks.toml')
@@ -297,14 +335,34 @@ class WeeklySchedule:
 
     def __init__(self, odd_path: str, even_path: str):
         """
-        Load odd and even week schedules from TOML files.
+        Remember the odd and even week schedule files.
+
+        Files are parsed lazily, so only the schedule for the current
+        week parity is read unless the other one is explicitly needed.
+        Both files are checked for existence up front so a missing file
+        still fails at startup rather than at the next week boundary.
 
         Args:
             odd_path: Path to odd weeks TOML file
             even_path: Path to even weeks TOML file
+
+        Raises:
+            FileNotFoundError: If either schedule file doesn't exist
         """
-        self.odd_data = load_toml_file(odd_path)
-        self.even_data = load_toml_file(even_path)
+        os.stat(odd_path)
+        os.stat(even_path)
+        self.odd_path = odd_path
+        self.even_path = even_path
+
+    @cached_property
+    def odd_data(self) -> dict:
+        """Schedule dict for odd weeks, parsed on first access."""
+        return load_toml_file(self.odd_path)
+
+    @cached_property
+    def even_data(self) -> dict:
+        """Schedule dict for even weeks, parsed on first access."""
+        return load_toml_file(self.even_path)
 
     def get_schedule_for_parity(self, parity: str) -> dict:
         """
@@ -341,12 +399,7 @@ class WeeklySchedule:
             return {}
 
         # Determine current day and week parity
-        now = datetime.now()
-        weekday = now.strftime("%A").lower()
-
-        # Import here to avoid circular dependency
-        from schedule_management.time_utils import get_week_parity
-
+        weekday = weekday_name(datetime.now())
         parity = get_week_parity()
 
         # Get schedule for current week parity
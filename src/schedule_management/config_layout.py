@@ -52,6 +52,10 @@ class RuntimePaths:
     mode_path: Path
 
 
+# root dir -> (layout signature, resolved paths); see _layout_signature().
+_RUNTIME_PATHS_CACHE: dict[Path, tuple[tuple[int, str | None], RuntimePaths]] = {}
+
+
 class DynamicPath(os.PathLike[str]):
     """Path-like wrapper that resolves against the current active config set."""
 
@@ -134,9 +138,6 @@ def has_legacy_config_files(root_dir: Path | None = None) -> bool:
 
 def _read_active_config_marker(root_dir: Path) -> int | None:
     marker_path = root_dir / ACTIVE_CONFIG_MARKER
-    if not marker_path.exists():
-        return None
-
     try:
         raw_value = marker_path.read_text(encoding="utf-8").strip()
     except OSError:
@@ -263,16 +264,48 @@ def clone_active_config_dir(
     return next_id, target_dir
 
 
+def _layout_signature(root_dir: Path) -> tuple[int, str | None] | None:
+    """
+    Return a cheap fingerprint of the on-disk layout under ``root_dir``.
+
+    Adding, removing or renaming a ``user_config_n`` directory (or a legacy
+    flat file) bumps the root directory's mtime, and switching config sets
+    rewrites the active marker, so together they tell us whether a previously
+    resolved ``RuntimePaths`` is still valid. Returns None when the root does
+    not exist yet, in which case nothing is cached.
+    """
+    try:
+        root_mtime = root_dir.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    try:
+        marker = (root_dir / ACTIVE_CONFIG_MARKER).read_text(encoding="utf-8")
+    except OSError:
+        marker = None
+    return root_mtime, marker
+
+
 def resolve_runtime_paths(root_dir: Path | None = None) -> RuntimePaths:
     """Resolve all runtime paths for the active config set and shared task data."""
     actual_root = root_dir or resolve_config_root_dir()
+
+    # Every DynamicPath access lands here, so skip the directory scans and
+    # migration checks while the layout on disk is unchanged.
+    signature = _layout_signature(actual_root)
+    cached = _RUNTIME_PATHS_CACHE.get(actual_root)
+    if signature is not None and cached is not None and cached[0] == signature:
+        return cached[1]
+
     active_id = resolve_active_config_id(actual_root)
-    active_config_dir = resolve_active_config_dir(actual_root)
     if active_id is None:
+        active_config_dir = resolve_active_config_dir(actual_root)
         active_id = 0
+    else:
+        active_config_dir = get_config_dir(actual_root, active_id)
 
     tasks_dir = actual_root / "tasks"
-    return RuntimePaths(
+    paths = RuntimePaths(
         root_dir=actual_root,
         active_id=active_id,
         active_config_dir=active_config_dir,
@@ -289,6 +322,13 @@ def resolve_runtime_paths(root_dir: Path | None = None) -> RuntimePaths:
         mode_path=tasks_dir / "mode.txt",
     )
 
+    # Re-read the signature: resolving may have migrated files or written
+    # the active marker, which changes the layout we just resolved against.
+    signature = _layout_signature(actual_root)
+    if signature is not None:
+        _RUNTIME_PATHS_CACHE[actual_root] = (signature, paths)
+    return paths
+
 
 __all__ = [
     "ACTIVE_CONFIG_MARKER",
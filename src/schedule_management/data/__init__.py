@@ -3,7 +3,8 @@ Data Package - Data loading and persistence for the schedule management system.
 
 This package provides functions to load and save various data files:
 - Tasks: JSON file containing task list with priorities
-- Task Log: JSON file tracking task actions (add/update/delete)
+- Task Log: JSON Lines file tracking task actions (add/update/delete)
+- TasksDB: context manager batching task changes into one load and save
 - Deadlines: JSON file containing deadline events
 - Habits: TOML configuration and JSON records for habit tracking
 """
@@ -15,9 +16,16 @@ from schedule_management.data.loaders import (
     load_procrastinate_records,
     save_procrastinate_list,
     get_procrastinate_age_days,
+    parse_task_log,
+    iter_task_log,
+    iter_task_log_reversed,
     load_task_log,
     save_task_log,
+    append_task_log_entry,
+    append_task_log_entries,
     log_task_action,
+    log_task_actions,
+    TasksDB,
     load_deadlines,
     save_deadlines,
     load_habits,
@@ -34,9 +42,16 @@ __all__ = [
     "load_procrastinate_records",
     "save_procrastinate_list",
     "get_procrastinate_age_days",
+    "parse_task_log",
+    "iter_task_log",
+    "iter_task_log_reversed",
     "load_task_log",
     "save_task_log",
+    "append_task_log_entry",
+    "append_task_log_entries",
     "log_task_action",
+    "log_task_actions",
+    "TasksDB",
     "load_deadlines",
     "save_deadlines",
     "load_habits",
@@ -3,12 +3,14 @@ Data Loaders - Functions for loading and saving data files.
 
 This module provides functions for persistent storage operations:
 - Tasks: JSON file with task list and priorities
-- Task Log: JSON file tracking all task actions
+- Task Log: JSON Lines file tracking all task actions
 - Deadlines: JSON file with deadline events
 - Habits: TOML config and JSON records
 
 All functions handle file errors gracefully and ensure parent
-directories exist before writing.
+directories exist before writing. The tasks file and task log are
+cached in memory and only re-parsed when their modification time or
+size changes.
 
 Example Usage:
     >>> from schedule_management.data import load_tasks, save_tasks
@@ -19,12 +21,22 @@ Example Usage:
 """
 
 import json
+import os
 import sys
+import tempfile
 import tomllib
+from collections.abc import Callable, Iterator
 from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from schedule_management import (
     TASKS_PATH,
     TASK_LOG_PATH,
@@ -36,6 +48,138 @@ from schedule_management import (
 )
 
 
+# =============================================================================
+# JSON READ CACHE
+# =============================================================================
+
+def _json_loads(text: str | bytes) -> Any:
+    """Parse JSON text, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _json_dumps(value: Any, indent: bool = False) -> str:
+    """
+    Serialize a value to JSON text, using orjson when it is installed.
+
+    Both backends write non-ASCII characters as-is.
+
+    Args:
+        value: JSON-serializable value
+        indent: Indent nested values by two spaces instead of one line
+
+    Returns:
+        The JSON text
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(value, option=option).decode("utf-8")
+    return json.dumps(value, indent=2 if indent else None, ensure_ascii=False)
+
+
+# Parsed JSON lists keyed by absolute path: {path: ((mtime_ns, size), records)}
+_JSON_CACHE: dict[str, tuple[tuple[int, int], list[Any]]] = {}
+
+
+def _copy_records(records: list[Any]) -> list[Any]:
+    """Return a copy of a record list whose top-level dicts may be mutated."""
+    return [dict(item) if isinstance(item, dict) else item for item in records]
+
+
+def _file_signature(path: str) -> tuple[int, int]:
+    """Return the (mtime_ns, size) pair used to validate cached data."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_json_list(
+    file_path: str | Path, parse: Callable[[str], Any] = _json_loads
+) -> list[Any]:
+    """
+    Load a JSON list, reusing the parsed result while the file is unchanged.
+
+    Args:
+        file_path: Path to the JSON file
+        parse: Function turning the file content into a list
+
+    Returns:
+        A copy of the parsed list, safe for the caller to modify
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    cache_key = os.path.abspath(os.fspath(file_path))
+    signature = _file_signature(cache_key)
+
+    cached = _JSON_CACHE.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return _copy_records(cached[1])
+
+    with open(cache_key, "r", encoding="utf-8") as f:
+        data = parse(f.read())
+    if isinstance(data, list):
+        _JSON_CACHE[cache_key] = (signature, _copy_records(data))
+    return data
+
+
+# Mode open(path, "w") gives a new file under the process umask
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_NEW_FILE_MODE = 0o666 & ~_UMASK
+
+
+def _write_file_atomically(path: Path, text: str) -> None:
+    """
+    Replace a file's content without ever exposing a partial write.
+
+    The text is written and fsynced to a uniquely named sibling temporary
+    file, which then replaces the target in a single rename, so concurrent
+    writers never share a temporary file.
+
+    Args:
+        path: File to replace
+        text: New file content
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with open(fd, "w", encoding="utf-8") as f:
+            # mkstemp creates 0600 files; keep the mode a plain open() would give
+            try:
+                mode = os.stat(path).st_mode & 0o777
+            except FileNotFoundError:
+                mode = _NEW_FILE_MODE
+            os.fchmod(f.fileno(), mode)
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _save_json_list(file_path: str | Path, records: list[Any]) -> None:
+    """
+    Write a JSON list and remember it as the cached content of the file.
+
+    Creates parent directories if they don't exist. The file is replaced
+    atomically, so an interrupted save leaves the previous content intact.
+
+    Args:
+        file_path: Path to the JSON file
+        records: List to serialize
+    """
+    path = Path(file_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    _write_file_atomically(path, _json_dumps(records, indent=True))
+
+    cache_key = os.path.abspath(path)
+    _JSON_CACHE[cache_key] = (_file_signature(cache_key), _copy_records(records))
+
+
 # =============================================================================
 # TASK MANAGEMENT
 # =============================================================================
@@ -55,8 +199,7 @@ def load_tasks() -> list[dict[str, Any]]:
         ...     print(f"{task['description']} (priority: {task['priority']})")
     """
     try:
-        with open(TASKS_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return _load_json_list(TASKS_PATH)
     except (json.JSONDecodeError, FileNotFoundError):
         print("Error loading tasks file, starting with an empty task list.", file=sys.stderr)
         return []
@@ -75,11 +218,7 @@ def save_tasks(tasks: list[dict[str, Any]]) -> None:
         >>> tasks = [{'description': 'Study', 'priority': 8}]
         >>> save_tasks(tasks)
     """
-    tasks_path = Path(TASKS_PATH)
-    tasks_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(tasks_path, "w", encoding="utf-8") as f:
-        json.dump(tasks, f, indent=2, ensure_ascii=False)
+    _save_json_list(TASKS_PATH, tasks)
 
 
 def load_procrastinate_list() -> set[str]:
@@ -104,8 +243,8 @@ def load_procrastinate_records() -> dict[str, dict[str, str]]:
         Mapping of task description to normalized record metadata.
     """
     try:
-        with open(PROCRASTINATE_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(PROCRASTINATE_PATH, "rb") as f:
+            data = _json_loads(f.read())
     except (json.JSONDecodeError, FileNotFoundError):
         return {}
 
@@ -174,8 +313,7 @@ def save_procrastinate_list(
             record["since"] = since
         serialized_records.append(record)
 
-    with open(procrastinate_path, "w", encoding="utf-8") as f:
-        json.dump(serialized_records, f, indent=2, ensure_ascii=False)
+    _write_file_atomically(procrastinate_path, _json_dumps(serialized_records, indent=True))
 
 
 def get_procrastinate_age_days(
@@ -208,41 +346,262 @@ def get_procrastinate_age_days(
 # =============================================================================
 
 
+def _parse_task_log_line(line: str | bytes) -> dict[str, Any] | None:
+    """Parse one JSON Lines log entry, or return None for blank/invalid lines."""
+    if not line.strip():
+        return None
+    try:
+        entry = _json_loads(line)
+    except json.JSONDecodeError:
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def parse_task_log(text: str) -> list[dict[str, Any]]:
+    """
+    Parse task log content in JSON Lines or legacy JSON-array format.
+
+    Blank lines and lines that are not valid JSON objects (such as a
+    partially written last line) are skipped.
+
+    Args:
+        text: Content of the task log file
+
+    Returns:
+        List of log entry dictionaries
+
+    Raises:
+        json.JSONDecodeError: If a legacy JSON-array log is invalid
+    """
+    if text.lstrip().startswith("["):
+        data = _json_loads(text)
+        return data if isinstance(data, list) else []
+
+    entries = []
+    for line in text.splitlines():
+        entry = _parse_task_log_line(line)
+        if entry is not None:
+            entries.append(entry)
+    return entries
+
+
+def iter_task_log() -> Iterator[dict[str, Any]]:
+    """
+    Yield task log entries oldest first, one line at a time.
+
+    Only the current line is held in memory. A legacy JSON-array log
+    has no line structure and is parsed as a whole.
+
+    Yields:
+        Log entry dictionaries; nothing if the file is missing or invalid
+    """
+    try:
+        f = open(TASK_LOG_PATH, "r", encoding="utf-8")
+    except FileNotFoundError:
+        return
+
+    with f:
+        for line in f:
+            if not line.strip():
+                continue
+            if line.lstrip().startswith("["):
+                try:
+                    yield from parse_task_log(line + f.read())
+                except json.JSONDecodeError:
+                    pass
+                return
+            entry = _parse_task_log_line(line)
+            if entry is not None:
+                yield entry
+
+
+def iter_task_log_reversed(chunk_size: int = 1 << 16) -> Iterator[dict[str, Any]]:
+    """
+    Yield task log entries newest first, reading the file from its end.
+
+    Callers interested only in recent entries can stop early without
+    reading the rest of the log.
+
+    Args:
+        chunk_size: Number of bytes read per backward step
+
+    Yields:
+        Log entry dictionaries; nothing if the file is missing or invalid
+    """
+    try:
+        f = open(TASK_LOG_PATH, "rb")
+    except FileNotFoundError:
+        return
+
+    with f:
+        if f.read(64).lstrip().startswith(b"["):
+            f.seek(0)
+            try:
+                entries = parse_task_log(f.read().decode("utf-8"))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                return
+            yield from reversed(entries)
+            return
+
+        position = f.seek(0, os.SEEK_END)
+        partial_line = b""
+        while position > 0:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            f.seek(position)
+            lines = (f.read(read_size) + partial_line).split(b"\n")
+            # The first piece may continue in the previous chunk
+            partial_line = lines[0]
+            for line in reversed(lines[1:]):
+                entry = _parse_task_log_line(line)
+                if entry is not None:
+                    yield entry
+
+        entry = _parse_task_log_line(partial_line)
+        if entry is not None:
+            yield entry
+
+
 def load_task_log() -> list[dict[str, Any]]:
     """
-    Load task action log from the JSON file.
+    Load task action log from the JSON Lines file.
 
     The log tracks all task operations (added, updated, deleted)
-    with timestamps for history and reporting.
+    with timestamps for history and reporting. Logs written in the
+    older single JSON-array format are still readable.
 
     Returns:
         List of log entry dictionaries.
         Returns empty list if file not found or invalid.
     """
     try:
-        with open(TASK_LOG_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return _load_json_list(TASK_LOG_PATH, parse=parse_task_log)
     except (json.JSONDecodeError, FileNotFoundError):
         return []
 
 
 def save_task_log(log_entries: list[dict[str, Any]]) -> None:
     """
-    Save task action log to the JSON file.
+    Save the whole task action log as JSON Lines.
 
-    Creates parent directories if they don't exist.
+    Creates parent directories if they don't exist. The file is replaced
+    atomically, so an interrupted save leaves the previous log intact.
 
     Args:
         log_entries: List of log entry dictionaries to save
     """
     log_path = Path(TASK_LOG_PATH)
-    if not log_path:
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+
+    _write_file_atomically(
+        log_path, "".join(_json_dumps(entry) + "\n" for entry in log_entries)
+    )
+
+    cache_key = os.path.abspath(log_path)
+    _JSON_CACHE[cache_key] = (_file_signature(cache_key), _copy_records(log_entries))
+
+
+# Task logs already checked for the legacy JSON-array format in this process
+_CHECKED_TASK_LOGS: set[str] = set()
+
+
+def _migrate_legacy_task_log(log_path: Path) -> None:
+    """
+    Rewrite a legacy JSON-array task log as JSON Lines, once per process.
+
+    A legacy log that no longer parses is moved aside to a timestamped
+    ``.corrupt`` file, so appended lines start a clean JSON Lines log
+    instead of trailing a broken array.
+    """
+    cache_key = os.path.abspath(log_path)
+    if cache_key in _CHECKED_TASK_LOGS:
         return
 
+    text = None
+    try:
+        with open(log_path, "r", encoding="utf-8") as f:
+            if f.read(64).lstrip().startswith("["):
+                f.seek(0)
+                text = f.read()
+    except FileNotFoundError:
+        pass
+
+    if text is not None:
+        try:
+            entries = parse_task_log(text)
+        except json.JSONDecodeError:
+            stamp = datetime.now().strftime("%Y%m%dT%H%M%S")
+            corrupt_path = log_path.with_name(f"{log_path.name}.corrupt-{stamp}")
+            os.replace(log_path, corrupt_path)
+            _JSON_CACHE.pop(cache_key, None)
+            print(
+                f"Task log is not valid JSON, moved it to {corrupt_path}",
+                file=sys.stderr,
+            )
+        else:
+            save_task_log(entries)
+
+    _CHECKED_TASK_LOGS.add(cache_key)
+
+
+def append_task_log_entries(entries: list[dict[str, Any]]) -> None:
+    """
+    Append entries to the task log without rewriting earlier entries.
+
+    All entries are written through a single open of the file. Creates
+    parent directories if they don't exist, and converts a legacy
+    JSON-array log to JSON Lines before the first append.
+
+    Args:
+        entries: Log entry dictionaries to append, in order
+    """
+    if not entries:
+        return
+
+    log_path = Path(TASK_LOG_PATH)
     log_path.parent.mkdir(parents=True, exist_ok=True)
+    _migrate_legacy_task_log(log_path)
+
+    cache_key = os.path.abspath(log_path)
+    cached = _JSON_CACHE.get(cache_key)
+    try:
+        fresh = cached is not None and cached[0] == _file_signature(cache_key)
+    except FileNotFoundError:
+        fresh = False
+
+    with open(log_path, "a", encoding="utf-8") as f:
+        f.writelines(_json_dumps(entry) + "\n" for entry in entries)
+
+    # Extend an up-to-date cached log instead of re-reading it later
+    if fresh:
+        cached[1].extend(dict(entry) for entry in entries)
+        _JSON_CACHE[cache_key] = (_file_signature(cache_key), cached[1])
+
+
+def append_task_log_entry(entry: dict[str, Any]) -> None:
+    """
+    Append one entry to the task log.
+
+    Args:
+        entry: Log entry dictionary to append
+    """
+    append_task_log_entries([entry])
+
+
+def _build_task_log_entry(
+    action: str, task: dict[str, Any], metadata: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """Build a timestamped task log entry."""
+    log_entry = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "action": action,
+        "task": task.copy(),
+    }
 
-    with open(log_path, "w", encoding="utf-8") as f:
-        json.dump(log_entries, f, indent=2, ensure_ascii=False)
+    if metadata:
+        log_entry["metadata"] = metadata.copy()
+
+    return log_entry
 
 
 def log_task_action(
@@ -264,22 +623,118 @@ def log_task_action(
         >>> log_task_action('added', task)
         >>> log_task_action('updated', task, {'old_priority': 5})
     """
-    log_path = Path(TASK_LOG_PATH)
-    if not log_path:
-        return
+    append_task_log_entry(_build_task_log_entry(action, task, metadata))
 
-    log_entry = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "action": action,
-        "task": task.copy(),
-    }
 
-    if metadata:
-        log_entry["metadata"] = metadata.copy()
+def log_task_actions(action: str, tasks: list[dict[str, Any]]) -> None:
+    """
+    Log the same action for several tasks with a single log write.
 
-    log_entries = load_task_log()
-    log_entries.append(log_entry)
-    save_task_log(log_entries)
+    Args:
+        action: Action type ('added', 'updated', 'deleted')
+        tasks: Task dictionaries that were affected
+
+    Example:
+        >>> log_task_actions('deleted', [task_a, task_b])
+    """
+    append_task_log_entries([_build_task_log_entry(action, task) for task in tasks])
+
+
+# =============================================================================
+# BATCHED TASK UPDATES
+# =============================================================================
+
+
+class TasksDB:
+    """
+    Batch task list changes into one load and one save.
+
+    The task list is loaded on entry and written back, together with the
+    task log entries for every change, once on a clean exit. Nothing is
+    written if the block raises.
+
+    Attributes:
+        tasks: The in-memory task list being edited
+
+    Example:
+        >>> with TasksDB() as db:
+        ...     db.add('Study', 8)
+        ...     db.delete('Clean room')
+    """
+
+    def __init__(self) -> None:
+        self.tasks: list[dict[str, Any]] = []
+        self._index: dict[str, int] = {}
+        self._log_entries: list[dict[str, Any]] = []
+
+    def __enter__(self) -> "TasksDB":
+        self.tasks = load_tasks()
+        self._reindex()
+        self._log_entries = []
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None and self._log_entries:
+            save_tasks(self.tasks)
+            append_task_log_entries(self._log_entries)
+        return False
+
+    def _reindex(self) -> None:
+        """Rebuild the description -> first list position index."""
+        self._index = {}
+        for index, task in enumerate(self.tasks):
+            self._index.setdefault(task["description"], index)
+
+    def add(
+        self, description: str, priority: int, alarm_from: str | None = None
+    ) -> int | None:
+        """
+        Add a task, or replace the existing task with the same description.
+
+        Args:
+            description: Task description
+            priority: Task priority
+            alarm_from: Optional ISO date before which urgent alarms are postponed
+
+        Returns:
+            The replaced task's priority, or None if the task is new
+        """
+        new_task: dict[str, Any] = {"description": description, "priority": priority}
+        if alarm_from:
+            new_task["alarm_from"] = alarm_from
+
+        index = self._index.get(description)
+        if index is not None:
+            old_priority = self.tasks[index]["priority"]
+            self.tasks[index] = new_task
+            self._log_entries.append(
+                _build_task_log_entry("updated", new_task, {"old_priority": old_priority})
+            )
+            return old_priority
+
+        self._index[description] = len(self.tasks)
+        self.tasks.append(new_task)
+        self._log_entries.append(_build_task_log_entry("added", new_task))
+        return None
+
+    def delete(self, description: str) -> list[dict[str, Any]]:
+        """
+        Delete every task with the given description.
+
+        Args:
+            description: Task description to remove
+
+        Returns:
+            The removed tasks (empty if none matched)
+        """
+        if description not in self._index:
+            return []
+
+        removed = [task for task in self.tasks if task["description"] == description]
+        self.tasks = [task for task in self.tasks if task["description"] != description]
+        self._reindex()
+        self._log_entries.extend(_build_task_log_entry("deleted", task) for task in removed)
+        return removed
 
 
 # =============================================================================
@@ -301,8 +756,8 @@ def load_deadlines() -> list[dict[str, Any]]:
         ...     print(f"{ddl['event']}: {ddl['deadline']}")
     """
     try:
-        with open(DDL_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(DDL_PATH, "rb") as f:
+            return _json_loads(f.read())
     except (json.JSONDecodeError, FileNotFoundError):
         print("Error loading deadlines file, starting with an empty deadline list.", file=sys.stderr)
         return []
@@ -320,8 +775,7 @@ def save_deadlines(deadlines: list[dict[str, Any]]) -> None:
     ddl_path = Path(DDL_PATH)
     ddl_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(ddl_path, "w", encoding="utf-8") as f:
-        json.dump(deadlines, f, indent=2, ensure_ascii=False)
+    _write_file_atomically(ddl_path, _json_dumps(deadlines, indent=True))
 
 
 # =============================================================================
@@ -383,13 +837,9 @@ def load_habit_records() -> list[dict[str, Any]]:
         >>> for record in records:
         ...     print(f"{record['date']}: {len(record['completed'])} habits")
     """
-    record_path = Path(RECORD_PATH)
-    if not record_path.exists():
-        return []
-
     try:
-        with open(record_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(RECORD_PATH, "rb") as f:
+            return _json_loads(f.read())
     except (json.JSONDecodeError, FileNotFoundError):
         return []
 
@@ -406,8 +856,7 @@ def save_habit_records(records: list[dict[str, Any]]) -> None:
     record_path = Path(RECORD_PATH)
     record_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(record_path, "w", encoding="utf-8") as f:
-        json.dump(records, f, indent=2, ensure_ascii=False)
+    _write_file_atomically(record_path, _json_dumps(records, indent=True))
 
 
 # =============================================================================
@@ -425,10 +874,7 @@ def load_mode() -> str:
         The current mode string, either 'j' or 'p'.
     """
     try:
-        mode_path = Path(MODE_PATH)
-        if not mode_path.exists():
-            return "j"
-        with open(mode_path, "r", encoding="utf-8") as f:
+        with open(MODE_PATH, "r", encoding="utf-8") as f:
             val = f.read().strip().lower()
             return "p" if val == "p" else "j"
     except Exception:
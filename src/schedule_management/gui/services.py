@@ -39,6 +39,7 @@ from schedule_management.synced_schedule import (
     load_synced_schedule,
     synced_schedule_matches_today,
 )
+from schedule_management.time_utils import weekday_name
 
 
 class GuiError(Exception):
@@ -294,7 +295,7 @@ def status_snapshot(payload: dict[str, Any]) -> dict[str, Any]:
         config,
     )
     synced = load_synced_schedule()
-    weekday = current_date.strftime("%A").lower()
+    weekday = weekday_name(current_date)
 
     return {
         "config": {
@@ -10,7 +10,6 @@ The active language is determined by:
 
 import os
 import tomllib
-from pathlib import Path
 from schedule_management.config_layout import resolve_runtime_paths
 
 
@@ -76,6 +75,16 @@ ZH_TRANSLATIONS = {
     "❌ Error saving tasks: {e}": "❌ 保存任务错误：{e}",
     "Task '{task_description}'": "任务 '{task_description}'",
     "{deleted_count} tasks with description '{task_description}'": "{deleted_count} 个描述为 '{task_description}' 的任务",
+    "invalid JSON ({e})": "JSON 无效（{e}）",
+    "expected a JSON object": "应为 JSON 对象",
+    "'op' must be 'add' or 'rm'": "'op' 必须是 'add' 或 'rm'",
+    "'task' must be a non-empty string": "'task' 必须是非空字符串",
+    "'priority' must be a positive integer": "'priority' 必须是正整数",
+    "'postpone' must be a non-negative integer": "'postpone' 必须是非负整数",
+    "❌ Line {line_number}: {error}": "❌ 第 {line_number} 行：{error}",
+    "❌ No changes made": "❌ 未做任何更改",
+    "⚠️  No operations to apply": "⚠️ 没有需要执行的操作",
+    "✅ Batch applied: {added} added, {updated} updated, {deleted} deleted": "✅ 批量操作完成：新增 {added} 个，更新 {updated} 个，删除 {deleted} 个",
     " (deferred today)": " (今天已延期)",
     " (1 day)": " (1 天)",
     " ({age_days} days)": " ({age_days} 天)",
@@ -146,6 +155,7 @@ ZH_TRANSLATIONS = {
     "❌ Currently in p mode. Switch back to j mode to execute this command.": "❌ 当前处于 p mode，若想使用则切换到 j mode",
     "📊 Generating schedule visualizations...": "📊 正在生成日程可视化...",
     "\n📁 Visualization file generated:": "\n📁 可视化文件已生成：",
+    "✅ Visualization is up to date (use --force to regenerate)": "✅ 可视化文件已是最新（使用 --force 重新生成）",
     "\n🖼️  Opening visualization...": "\n🖼️ 正在打开可视化...",
     "⚠️  Could not open file: {e}": "⚠️ 无法打开文件：{e}",
     "❌ Error generating visualizations: {e}": "❌ 生成可视化错误：{e}",
@@ -5,6 +5,7 @@ This module provides platform-agnostic functions for:
 - Platform detection (macOS, Linux, Windows)
 - Sound playback using native audio systems
 - Dialog/notification display using native UI frameworks
+- Non-blocking desktop notifications
 - Multi-select and Yes/No prompt dialogs
 
 Supported Platforms:
@@ -19,8 +20,14 @@ Example Usage:
     >>> show_dialog('Reminder: Time for a break!')
 """
 
+import atexit
+import os
+import shutil
 import subprocess
 import sys
+import tempfile
+from collections.abc import Callable
+from functools import cache
 
 
 # =============================================================================
@@ -57,20 +64,27 @@ def get_platform() -> str:
 # =============================================================================
 
 
-def play_sound_macos(sound_file: str) -> None:
+def play_sound_macos(sound_file: str) -> subprocess.Popen:
     """
     Play a sound file on macOS using the afplay command.
 
     Args:
         sound_file: Path to the audio file (typically .aiff or .mp3)
 
+    Returns:
+        The running afplay process
+
     Note:
         Runs asynchronously using Popen, so the function returns immediately.
     """
-    subprocess.Popen(["afplay", sound_file])
+    return subprocess.Popen(
+        ["afplay", sound_file],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
 
 
-def play_sound_linux(sound_file: str) -> None:
+def play_sound_linux(sound_file: str) -> subprocess.Popen | None:
     """
     Play a sound file on Linux using available audio backends.
 
@@ -82,19 +96,50 @@ def play_sound_linux(sound_file: str) -> None:
     Args:
         sound_file: Path to the audio file
 
+    Returns:
+        The running player process, or None if no backend is available
+
     Note:
         Falls back to next backend if current one is not available.
     """
     for cmd in [["paplay", sound_file], ["aplay", sound_file], ["play", sound_file]]:
         try:
-            subprocess.Popen(cmd, stderr=subprocess.DEVNULL)
-            return
+            return subprocess.Popen(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
         except FileNotFoundError:
             continue
     print(f"Warning: Could not play sound {sound_file}")
+    return None
+
+
+def _play_sound_unsupported(sound_file: str) -> None:
+    """Report that sound playback is unavailable on this platform."""
+    print(f"Sound playback not supported on {get_platform()}")
+    return None
+
 
+def resolve_sound_player() -> Callable[[str], subprocess.Popen | None]:
+    """
+    Return the sound playback function for the current platform.
 
-def play_sound(sound_file: str) -> None:
+    Callers that play sounds repeatedly (such as the alarm loop) can
+    resolve the backend once instead of re-detecting the platform on
+    every call.
+
+    Returns:
+        A callable taking the sound file path and returning the player
+        process (or None when nothing was started)
+    """
+    platform_name = get_platform()
+    if platform_name == "macos":
+        return play_sound_macos
+    if platform_name == "linux":
+        return play_sound_linux
+    return _play_sound_unsupported
+
+
+def play_sound(sound_file: str) -> subprocess.Popen | None:
     """
     Play a sound file using the appropriate system audio backend.
 
@@ -104,16 +149,13 @@ def play_sound(sound_file: str) -> None:
     Args:
         sound_file: Path to the audio file to play
 
+    Returns:
+        The running player process, or None if playback is unavailable
+
     Example:
         >>> play_sound('/System/Library/Sounds/Ping.aiff')
     """
-    platform_name = get_platform()
-    if platform_name == "macos":
-        play_sound_macos(sound_file)
-    elif platform_name == "linux":
-        play_sound_linux(sound_file)
-    else:
-        print(f"Sound playback not supported on {platform_name}")
+    return resolve_sound_player()(sound_file)
 
 
 # =============================================================================
@@ -134,6 +176,52 @@ def _escape_applescript_string(value: str) -> str:
     return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
 
 
+# Fixed dialog program; the message arrives as the first script argument, so
+# it never needs AppleScript quoting and the program text never changes.
+_ALARM_DIALOG_SOURCE = (
+    "on run argv",
+    'display dialog (item 1 of argv) buttons {"停止闹铃"} default button "停止闹铃"',
+    "end run",
+)
+_ALARM_DIALOG_COMMAND = (
+    "osascript",
+    *(part for line in _ALARM_DIALOG_SOURCE for part in ("-e", line)),
+)
+
+
+@cache
+def _alarm_dialog_command() -> tuple[str, ...]:
+    """
+    Return the osascript command prefix for the alarm dialog.
+
+    The dialog program is compiled once per process with osacompile, so
+    each alarm repetition only loads the compiled script instead of
+    re-parsing the AppleScript source. Falls back to the inline source
+    when compilation is unavailable or fails.
+
+    Returns:
+        Command prefix to which the message is appended
+    """
+    script_dir = tempfile.mkdtemp(prefix="schedule_management_")
+    script_path = os.path.join(script_dir, "alarm_dialog.scpt")
+    try:
+        result = subprocess.run(
+            ["osacompile", "-o", script_path, *_ALARM_DIALOG_COMMAND[1:]],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=30,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        result = None
+
+    if result is None or result.returncode != 0:
+        shutil.rmtree(script_dir, ignore_errors=True)
+        return _ALARM_DIALOG_COMMAND
+
+    atexit.register(shutil.rmtree, script_dir, ignore_errors=True)
+    return ("osascript", script_path)
+
+
 def show_dialog_macos(message: str) -> str:
     """
     Show an AppleScript dialog with a dismiss button on macOS.
@@ -145,12 +233,9 @@ def show_dialog_macos(message: str) -> str:
         The button clicked ('停止闹铃' typically)
     """
     result = subprocess.run(
-        [
-            "osascript",
-            "-e",
-            f'display dialog "{message}" buttons {{"停止闹铃"}} default button "停止闹铃"',
-        ],
-        capture_output=True,
+        [*_alarm_dialog_command(), message],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         text=True,
     )
     return result.stdout.strip()
@@ -186,6 +271,27 @@ def show_dialog_linux(message: str) -> str:
     return "OK"
 
 
+def _show_dialog_unsupported(message: str) -> str:
+    """Report that dialogs are unavailable on this platform."""
+    print(f"Dialog display not supported on {get_platform()}")
+    return "OK"
+
+
+def resolve_dialog() -> Callable[[str], str]:
+    """
+    Return the dialog function for the current platform.
+
+    Returns:
+        A callable taking the message and returning the button clicked
+    """
+    platform_name = get_platform()
+    if platform_name == "macos":
+        return show_dialog_macos
+    if platform_name == "linux":
+        return show_dialog_linux
+    return _show_dialog_unsupported
+
+
 def show_dialog(message: str) -> str:
     """
     Show a dialog/notification using the platform's native UI.
@@ -199,14 +305,53 @@ def show_dialog(message: str) -> str:
     Example:
         >>> result = show_dialog('Time for a break!')
     """
+    return resolve_dialog()(message)
+
+
+# =============================================================================
+# NOTIFICATIONS
+# =============================================================================
+
+# Non-modal banner; message and title are passed as script arguments.
+_NOTIFICATION_COMMAND = (
+    "osascript",
+    "-e",
+    "on run argv",
+    "-e",
+    "display notification (item 1 of argv) with title (item 2 of argv)",
+    "-e",
+    "end run",
+)
+
+
+def show_notification(message: str, title: str = "Reminder") -> None:
+    """
+    Show a non-blocking desktop notification.
+
+    Unlike show_dialog(), this returns immediately and does not wait for
+    the user to acknowledge the message.
+
+    Args:
+        message: The message to display
+        title: Notification title (default: 'Reminder')
+
+    Platform Support:
+        - macOS: Uses AppleScript 'display notification'
+        - Linux: Uses notify-send
+    """
     platform_name = get_platform()
     if platform_name == "macos":
-        return show_dialog_macos(message)
+        cmd = [*_NOTIFICATION_COMMAND, message, title]
     elif platform_name == "linux":
-        return show_dialog_linux(message)
+        cmd = ["notify-send", title, message]
     else:
-        print(f"Dialog display not supported on {platform_name}")
-        return "OK"
+        print(f"Notifications not supported on {platform_name}")
+        return
+
+    try:
+        subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except FileNotFoundError:
+        print(f"Warning: Could not show notification: {message}")
 
 
 # =============================================================================
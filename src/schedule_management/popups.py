@@ -18,14 +18,18 @@ Example Usage:
 
 import json
 from datetime import datetime
-from pathlib import Path
 from typing import Any
 
 from schedule_management import (
     SETTINGS_PATH,
     HABIT_PATH,
     TASK_LOG_PATH,
-    RECORD_PATH,
+)
+from schedule_management.data import (
+    iter_task_log_reversed,
+    load_habit_records,
+    parse_task_log,
+    save_habit_records,
 )
 from schedule_management.platform import play_sound, show_dialog, ask_yes_no
 from schedule_management.i18n import _t, get_language
@@ -38,14 +42,14 @@ from schedule_management.i18n import _t, get_language
 
 def load_task_log() -> list[dict[str, Any]]:
     """
-    Load task action log from the JSON file.
+    Load task action log from the JSON Lines file.
 
     Returns:
         List of task log entries (may be empty if file not found)
     """
     try:
         with open(TASK_LOG_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
+            return parse_task_log(f.read())
     except (json.JSONDecodeError, FileNotFoundError):
         return []
 
@@ -54,27 +58,28 @@ def get_today_completed_tasks() -> list[dict[str, Any]]:
     """
     Get tasks that were completed (deleted) today.
 
-    Scans the task log for 'deleted' actions with today's date.
-    Deleted tasks are considered completed in this system.
+    Scans the task log backwards for 'deleted' actions with today's date,
+    stopping at the first entry from an earlier day. Deleted tasks are
+    considered completed in this system.
 
     Returns:
         List of task info dicts with 'description' and 'priority'
     """
-    task_log = load_task_log()
     today = datetime.now().strftime("%Y-%m-%d")
 
     completed_tasks = []
-    for entry in task_log:
-        if entry.get("action") == "deleted":
-            try:
-                timestamp = entry.get("timestamp", "")
-                entry_date = timestamp.split("T")[0] if "T" in timestamp else ""
-                if entry_date == today:
-                    task_info = entry.get("task", {})
-                    completed_tasks.append(task_info)
-            except Exception:
-                continue
+    for entry in iter_task_log_reversed():
+        timestamp = entry.get("timestamp", "")
+        if not isinstance(timestamp, str) or "T" not in timestamp:
+            continue
+        entry_date = timestamp.split("T")[0]
+        # Entries are appended in time order, so older days come next
+        if entry_date < today:
+            break
+        if entry_date == today and entry.get("action") == "deleted":
+            completed_tasks.append(entry.get("task", {}))
 
+    completed_tasks.reverse()
     return completed_tasks
 
 
@@ -220,37 +225,6 @@ def _load_habits() -> dict[str, str]:
     return habits
 
 
-def _load_habit_records() -> list[dict[str, Any]]:
-    """
-    Load habit tracking records from JSON file.
-
-    Returns:
-        List of daily habit records
-    """
-    record_path = Path(RECORD_PATH)
-    if not record_path.exists():
-        return []
-    try:
-        with open(record_path, "r", encoding="utf-8") as fp:
-            data = json.load(fp)
-        return data if isinstance(data, list) else []
-    except (json.JSONDecodeError, OSError):
-        return []
-
-
-def _save_habit_records(records: list[dict[str, Any]]) -> None:
-    """
-    Save habit tracking records to JSON file.
-
-    Args:
-        records: List of daily habit records to save
-    """
-    record_path = Path(RECORD_PATH)
-    record_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(record_path, "w", encoding="utf-8") as fp:
-        json.dump(records, fp, indent=2, ensure_ascii=False)
-
-
 def show_habit_tracking_popup(now: datetime | None = None) -> bool:
     """
     Prompt for today's habits one by one and save the record.
@@ -306,7 +280,9 @@ def show_habit_tracking_popup(now: datetime | None = None) -> bool:
     completed = {habit_id: habits[habit_id] for habit_id in completed_ids}
 
     # Load existing records and update/add today's entry
-    records = _load_habit_records()
+    records = load_habit_records()
+    if not isinstance(records, list):
+        records = []
     existing_index = next(
         (i for i, r in enumerate(records) if r.get("date") == today), None
     )
@@ -322,5 +298,5 @@ def show_habit_tracking_popup(now: datetime | None = None) -> bool:
     else:
         records[existing_index] = new_record
 
-    _save_habit_records(records)
+    save_habit_records(records)
     return True
@@ -2,8 +2,10 @@ import json
 import os
 import tomllib
 import calendar
+from collections.abc import Callable
 from datetime import datetime, timedelta, date, time
 from pathlib import Path
+from typing import Any
 
 try:
     import matplotlib.pyplot as plt
@@ -21,6 +23,7 @@ from schedule_management import (
     RECORD_PATH,
     TASK_LOG_PATH,
 )
+from schedule_management.data import parse_task_log
 
 WEEKDAY_ALIASES = {
     "mon": 0,
@@ -633,13 +636,15 @@ def _load_settings(settings_file: Path) -> dict:
         return tomllib.load(fp)
 
 
-def _load_json_file(path: Path) -> list[dict]:
+def _load_json_file(
+    path: Path, parse: Callable[[str], Any] = json.loads
+) -> list[dict]:
     if not path.exists():
         print(f"⚠️  Data file not found: {path}")
         return []
     try:
         with open(path, "r", encoding="utf-8") as fp:
-            data = json.load(fp)
+            data = parse(fp.read())
             return data if isinstance(data, list) else []
     except (json.JSONDecodeError, OSError) as exc:
         print(f"⚠️  Could not read {path}: {exc}")
@@ -680,7 +685,7 @@ def auto_generate_reports(
         paths_section.get("reports_path", "~/Desktop/reports"), config_dir
     )
 
-    task_log = _load_json_file(Path(TASK_LOG_PATH))
+    task_log = _load_json_file(Path(TASK_LOG_PATH), parse=parse_task_log)
     habit_records = _load_json_file(Path(RECORD_PATH))
     habits_config = _load_habits_config(Path(HABIT_PATH))
 
@@ -709,7 +714,7 @@ def generate_manual_report(
         paths_section.get("reports_path", "~/Desktop/reports"), config_dir
     )
 
-    task_log = _load_json_file(Path(TASK_LOG_PATH))
+    task_log = _load_json_file(Path(TASK_LOG_PATH), parse=parse_task_log)
     habit_records = _load_json_file(Path(RECORD_PATH))
     habits_config = _load_habits_config(Path(HABIT_PATH))
 
@@ -10,8 +10,9 @@ runtime engine of the schedule management system. It:
 - Checks for urgent tasks and deadlines
 - Auto-generates weekly/monthly reports
 
-The runner operates as a continuous loop, checking every 20 seconds
-for events that need to be triggered.
+The runner operates as a continuous loop that sleeps until the next
+minute with something scheduled (capped at one minute), instead of
+polling the clock at a fixed interval.
 
 Example Usage:
     >>> from schedule_management.runner import ScheduleRunner
@@ -27,22 +28,26 @@ Entry Point:
     which loads configuration and starts the runner.
 """
 
-import json
+import signal
 import threading
 import time
-from datetime import datetime
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Callable
+from datetime import date, datetime
 from typing import Any
 
-from schedule_management import (
-    SETTINGS_PATH,
-    DDL_PATH,
-)
+from schedule_management import SETTINGS_PATH
 from schedule_management.config import ScheduleConfig, WeeklySchedule
 from schedule_management.i18n import _t
 from schedule_management.commands.deadlines import prune_expired_deadlines
 from schedule_management.synced_schedule import apply_synced_schedule
-from schedule_management.time_utils import add_minutes_to_time, alarm, get_week_parity
-from schedule_management.platform import ask_yes_no
+from schedule_management.time_utils import (
+    add_minutes_to_time,
+    alarm,
+    get_week_parity,
+    weekday_name,
+)
+from schedule_management.platform import ask_yes_no, play_sound, show_notification
 from schedule_management.data import (
     load_tasks,
     save_tasks,
@@ -52,6 +57,8 @@ from schedule_management.data import (
     get_procrastinate_age_days,
     log_task_action,
     load_mode,
+    load_deadlines,
+    save_deadlines,
 )
 from schedule_management.popups import (
     show_daily_summary_popup,
@@ -60,6 +67,17 @@ from schedule_management.popups import (
 from schedule_management.report import auto_generate_reports
 
 
+# Upper bound for a single sleep of the main loop. Sleeps are measured on a
+# monotonic clock that stops while the machine is suspended and ignores DST
+# jumps, so the wall clock is re-read at least this often to avoid sleeping
+# through events after a resume or a clock change.
+MAX_SLEEP_SECONDS = 60
+
+# Extra delay after a target minute starts, so the loop never wakes a few
+# milliseconds early and reads the previous minute from the clock.
+_WAKE_MARGIN_SECONDS = 1.0
+
+
 # =============================================================================
 # RUNTIME LOGGING
 # =============================================================================
@@ -97,6 +115,25 @@ def try_auto_generate_reports(settings_path: str) -> None:
         _log_runtime_event(f"Auto report generation skipped: {exc}")
 
 
+# =============================================================================
+# TIME HELPERS
+# =============================================================================
+
+
+def _minute_of_day(time_str: str) -> int | None:
+    """Convert an 'HH:MM' string to minutes since midnight (None if invalid)."""
+    hour, sep, minute = time_str.partition(":")
+    if not sep:
+        return None
+    try:
+        hours, minutes = int(hour), int(minute)
+    except ValueError:
+        return None
+    if not (0 <= hours < 24 and 0 <= minutes < 60):
+        return None
+    return hours * 60 + minutes
+
+
 # =============================================================================
 # SCHEDULE RUNNER
 # =============================================================================
@@ -125,19 +162,31 @@ class ScheduleRunner:
         >>> runner.run()  # Starts blocking main loop
     """
 
-    def __init__(self, config: ScheduleConfig, weekly_schedule: WeeklySchedule):
+    def __init__(
+        self,
+        config: ScheduleConfig,
+        weekly_schedule: WeeklySchedule,
+        sleep: Callable[[float], None] | None = None,
+    ):
         """
         Initialize the runner with configuration.
 
         Args:
             config: ScheduleConfig instance
             weekly_schedule: WeeklySchedule instance
+            sleep: Function used to wait between loop passes
+                (defaults to time.sleep)
         """
         self.config = config
         self.weekly_schedule = weekly_schedule
         self.notified_today = set()  # Events already handled today
         self.pending_end_alarms = {}  # {end_time_str: message}
         self._urgent_task_prompt_lock = threading.Lock()
+        self._day_cache = None  # (date, base_schedule, parity, weekday, skip_today)
+        self._static_trigger_minutes: list[int] = []  # Sorted, rebuilt per date
+        self._end_alarm_minutes: list[int] = []  # Sorted minutes of pending_end_alarms
+        self._sleep = sleep
+        self._reload_requested = False
 
     # =========================================================================
     # ALARM HANDLING
@@ -171,6 +220,17 @@ class ScheduleRunner:
             daemon=True,
         ).start()
 
+    def _notify(self, title: str, message: str) -> None:
+        """
+        Deliver a non-blocking reminder: one sound plus a notification.
+
+        Args:
+            title: Notification title
+            message: Notification body
+        """
+        play_sound(self.config.sound_file)
+        show_notification(message, title)
+
     # =========================================================================
     # EVENT HANDLING
     # =========================================================================
@@ -198,7 +258,10 @@ class ScheduleRunner:
                 else:
                     message = event  # Use string as message directly
                 _log_runtime_event(f"Time point triggered at {time_str}: {message}")
-                self._trigger_alarm(_t("Reminder"), message)
+                if self.config.time_point_alert == "notification":
+                    self._notify(_t("Reminder"), message)
+                else:
+                    self._trigger_alarm(_t("Reminder"), message)
                 self.notified_today.add(time_str)
         elif isinstance(event, dict) and "block" in event:
             # Dict with block type and optional title
@@ -211,6 +274,60 @@ class ScheduleRunner:
                     f"Warning: Unknown block type '{block_type}' at {time_str}"
                 )
 
+    def _fire_end_alarm(self, time_str: str, message: str) -> None:
+        """
+        Show the end notification of a finished time block.
+
+        Args:
+            time_str: The end time (HH:MM)
+            message: End message queued when the block started
+        """
+        _log_runtime_event(f"End alarm triggered at {time_str}: {message}")
+        self._trigger_alarm(_t("End Reminder"), message)
+
+    def _collect_due_events(
+        self, now_str: str, today_schedule: dict | None
+    ) -> list[tuple[str, Any]]:
+        """
+        Collect the schedule work due at the given minute.
+
+        End alarms come first so a block that ends exactly when the next
+        one starts reports both, instead of the start marking the minute
+        as handled and hiding the end alarm.
+
+        Args:
+            now_str: Current time (HH:MM)
+            today_schedule: Today's schedule (may be empty or None)
+
+        Returns:
+            List of (kind, payload) pairs where kind is 'end' or 'start'
+        """
+        due: list[tuple[str, Any]] = []
+        if now_str in self.pending_end_alarms:
+            due.append(("end", self._pop_end_alarm(now_str)))
+        if (
+            today_schedule
+            and now_str in today_schedule
+            and now_str not in self.notified_today
+        ):
+            due.append(("start", today_schedule[now_str]))
+        return due
+
+    def _dispatch_due_events(self, now_str: str, today_schedule: dict | None) -> None:
+        """
+        Fire every start event and end alarm due at the given minute.
+
+        Args:
+            now_str: Current time (HH:MM)
+            today_schedule: Today's schedule (may be empty or None)
+        """
+        handlers = {
+            "end": self._fire_end_alarm,
+            "start": self._handle_event,
+        }
+        for kind, payload in self._collect_due_events(now_str, today_schedule):
+            handlers[kind](now_str, payload)
+
     def _start_time_block(self, start_time: str, block_type: str, title: str) -> None:
         """
         Start a time block and schedule its end alarm.
@@ -233,7 +350,7 @@ class ScheduleRunner:
 
         # Schedule end notification
         end_message = _t("{title} finished! Take a break 🎉").format(title=title)
-        self.pending_end_alarms[end_time_str] = end_message
+        self._queue_end_alarm(end_time_str, end_message)
         _log_runtime_event(
             f"Time block started at {start_time}: {title} ({duration}min), ends at {end_time_str}"
         )
@@ -395,18 +512,15 @@ class ScheduleRunner:
         Returns:
             List of deadline dicts with days_left <= 3, sorted by urgency
         """
-        try:
-            with open(DDL_PATH, "r", encoding="utf-8") as f:
-                deadlines = json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
+        deadlines = load_deadlines()
+        if not deadlines:
             return []
 
         today = datetime.now().date()
         deadlines, removed_deadlines = prune_expired_deadlines(deadlines, today=today)
         if removed_deadlines:
             try:
-                with open(DDL_PATH, "w", encoding="utf-8") as f:
-                    json.dump(deadlines, f, indent=2, ensure_ascii=False)
+                save_deadlines(deadlines)
             except OSError as exc:
                 _log_runtime_event(f"Expired deadline cleanup skipped: {exc}")
 
@@ -482,6 +596,216 @@ class ScheduleRunner:
         )
         self._trigger_alarm(_t("Urgent Deadlines"), message, sound="Glass")
 
+    # =========================================================================
+    # DAILY SCHEDULE CACHE
+    # =========================================================================
+
+    def _refresh_day(self, today: date) -> tuple[dict, str, str, bool]:
+        """
+        Return today's base schedule, week parity, weekday and skip flag.
+
+        The merged odd/even schedule only changes when the date does, so it
+        is built once per day. Crossing into a new date also performs the
+        daily reset of notified events and pending end alarms. If the week
+        schedule cannot be loaded (missing or invalid TOML), the error is
+        logged and the day runs with an empty schedule instead of stopping
+        the runner.
+
+        Args:
+            today: Current date
+
+        Returns:
+            Tuple of (base_schedule, parity, weekday, skip_today)
+        """
+        cached = self._day_cache
+        if cached is not None and cached[0] == today:
+            return cached[1:]
+
+        if cached is not None:
+            _log_runtime_event("Midnight reset triggered")
+            self.notified_today.clear()
+            self.pending_end_alarms.clear()
+            self._end_alarm_minutes.clear()
+
+        skip_today = self.config.should_skip_today()
+        base_schedule = {}
+        if not skip_today:
+            try:
+                base_schedule = self.weekly_schedule.get_today_schedule(self.config)
+            except Exception as exc:
+                _log_runtime_event(f"Today's schedule could not be loaded: {exc}")
+        parity = get_week_parity(today)
+        weekday = weekday_name(today)
+        self._day_cache = (today, base_schedule, parity, weekday, skip_today)
+        self._static_trigger_minutes = self._build_static_trigger_minutes(base_schedule)
+        return base_schedule, parity, weekday, skip_today
+
+    # =========================================================================
+    # WAKE-UP SCHEDULING
+    # =========================================================================
+
+    def _config_trigger_times(self) -> list[str]:
+        """
+        Collect the HH:MM times configured in settings.toml that need a wake.
+
+        Covers the daily summary, habit prompt, urgent task/deadline checks
+        and weekly/monthly reviews.
+
+        Returns:
+            List of time strings (unsorted, may contain duplicates)
+        """
+        times: list[str] = [self.config.daily_summary_time]
+        if self.config.habit_prompt_time:
+            times.append(self.config.habit_prompt_time)
+        times.extend(self.config.daily_urgent_times)
+        times.extend(self.config.ddl_urgent_times)
+        for review_setting in (
+            self.config.weekly_review_time,
+            self.config.monthly_review_time,
+        ):
+            parts = review_setting.split() if review_setting else []
+            if len(parts) == 2:
+                times.append(parts[1])
+        return times
+
+    def _build_static_trigger_minutes(self, base_schedule: dict) -> list[int]:
+        """
+        Index the day's fixed trigger times as sorted minutes since midnight.
+
+        Built once per date from the base schedule and configured times, so
+        each wake only needs a binary search.
+
+        Args:
+            base_schedule: Today's base schedule (without the sync overlay)
+
+        Returns:
+            Sorted list of unique minutes since midnight
+        """
+        times = [*base_schedule, *self._config_trigger_times()]
+        return sorted(
+            {minute for minute in map(_minute_of_day, map(str, times)) if minute is not None}
+        )
+
+    def _queue_end_alarm(self, end_time_str: str, message: str) -> None:
+        """
+        Register a pending end alarm and index its minute for wake-ups.
+
+        Args:
+            end_time_str: End time (HH:MM)
+            message: Message to show when the block ends
+        """
+        self.pending_end_alarms[end_time_str] = message
+        minute = _minute_of_day(end_time_str)
+        if minute is not None:
+            insort(self._end_alarm_minutes, minute)
+
+    def _pop_end_alarm(self, time_str: str) -> str:
+        """
+        Remove and return the pending end alarm due at the given minute.
+
+        Args:
+            time_str: End time (HH:MM)
+
+        Returns:
+            The queued end message
+        """
+        message = self.pending_end_alarms.pop(time_str)
+        minute = _minute_of_day(time_str)
+        if minute is not None:
+            position = bisect_left(self._end_alarm_minutes, minute)
+            if self._end_alarm_minutes[position : position + 1] == [minute]:
+                del self._end_alarm_minutes[position]
+        return message
+
+    def _next_trigger_minute(
+        self, current_minute: int, today_schedule: dict | None
+    ) -> int | None:
+        """
+        Find the first minute after current_minute with work to do.
+
+        Args:
+            current_minute: Minutes since midnight of the current time
+            today_schedule: Today's schedule including the sync overlay
+
+        Returns:
+            Minute since midnight, or None when nothing is left today
+        """
+        candidates: list[int] = []
+        for minutes in (self._static_trigger_minutes, self._end_alarm_minutes):
+            position = bisect_right(minutes, current_minute)
+            if position < len(minutes):
+                candidates.append(minutes[position])
+
+        # Slots only present in the sync overlay are not in the static index
+        if today_schedule:
+            base_schedule = self._day_cache[1] if self._day_cache is not None else {}
+            for time_str in today_schedule.keys() - base_schedule.keys():
+                minute = _minute_of_day(str(time_str))
+                if minute is not None and minute > current_minute:
+                    candidates.append(minute)
+
+        return min(candidates, default=None)
+
+    def _seconds_until_next_check(
+        self, now: datetime, today_schedule: dict | None
+    ) -> float:
+        """
+        Compute how long the main loop can sleep before its next check.
+
+        The loop wakes just after the start of the next minute that has a
+        scheduled event, pending end alarm, popup, urgent check or review,
+        or at midnight for the daily reset, whichever comes first.
+
+        Args:
+            now: Current datetime
+            today_schedule: Today's schedule (may be empty or None)
+
+        Returns:
+            Seconds to sleep, clamped to [0, MAX_SLEEP_SECONDS]
+        """
+        current_minute = now.hour * 60 + now.minute
+        next_minute = self._next_trigger_minute(current_minute, today_schedule)
+        if next_minute is None:
+            next_minute = 24 * 60  # Midnight reset
+
+        elapsed = now.second + now.microsecond / 1_000_000
+        delay = (next_minute - current_minute) * 60 - elapsed + _WAKE_MARGIN_SECONDS
+        return min(max(delay, 0.0), float(MAX_SLEEP_SECONDS))
+
+    # =========================================================================
+    # CONFIGURATION RELOAD
+    # =========================================================================
+
+    def request_reload(self) -> None:
+        """
+        Ask the main loop to reload its configuration.
+
+        Safe to call from a signal handler: it only sets a flag, which the
+        loop checks at the start of its next pass.
+        """
+        self._reload_requested = True
+
+    def _reload_configuration(self) -> None:
+        """
+        Re-read settings and weekly schedules from disk.
+
+        On failure the previous configuration is kept and the error is logged.
+        """
+        from schedule_management import ODD_PATH, EVEN_PATH
+
+        self._reload_requested = False
+        try:
+            config = ScheduleConfig(SETTINGS_PATH)
+            weekly = WeeklySchedule(ODD_PATH, EVEN_PATH)
+        except Exception as exc:
+            _log_runtime_event(f"Configuration reload failed: {exc}")
+            return
+
+        self.config = config
+        self.weekly_schedule = weekly
+        self._day_cache = None  # Rebuild today's schedule on the next pass
+        _log_runtime_event("Configuration reloaded")
+
     # =========================================================================
     # MAIN LOOP
     # =========================================================================
@@ -494,26 +818,29 @@ class ScheduleRunner:
         This method runs forever until the process is terminated.
 
         The loop:
-        1. Checks if daily summary time is reached
-        2. Checks if habit prompt time is reached
-        3. Checks urgent task/deadline times
-        4. Checks weekly/monthly review times
-        5. Triggers scheduled events from today's schedule
-        6. Triggers pending end alarms
-        7. Resets at midnight
-        8. Sleeps 20 seconds before next check
+        1. Reloads configuration if requested, and rebuilds today's schedule
+           (and resets state) when the date changes
+        2. Checks if daily summary time is reached
+        3. Checks if habit prompt time is reached
+        4. Checks urgent task/deadline times
+        5. Checks weekly/monthly review times
+        6. Triggers pending end alarms and scheduled events for this minute
+        7. Sleeps until the next minute with something to trigger
         """
         while True:
+            if self._reload_requested:
+                self._reload_configuration()
+
             now = datetime.now()
-            now_str = now.strftime("%H:%M")
+            now_str = f"{now.hour:02d}:{now.minute:02d}"
             current_mode = load_mode()
-            today_schedule = self.weekly_schedule.get_today_schedule(self.config)
+            today_schedule, parity, weekday, skip_today = self._refresh_day(now.date())
             if today_schedule:
                 today_schedule = apply_synced_schedule(
                     today_schedule,
                     target_date=now.date(),
-                    parity=get_week_parity(),
-                    weekday=now.strftime("%A").lower(),
+                    parity=parity,
+                    weekday=weekday,
                 )
 
             # -----------------------------------------------------------------
@@ -523,7 +850,7 @@ class ScheduleRunner:
             if (
                 now_str == self.config.daily_summary_time
                 and daily_summary_key not in self.notified_today
-                and not self.config.should_skip_today()
+                and not skip_today
             ):
                 _log_runtime_event("Daily summary popup triggered")
                 threading.Thread(target=show_daily_summary_popup, daemon=True).start()
@@ -533,12 +860,12 @@ class ScheduleRunner:
             # Habit Prompt Time
             # -----------------------------------------------------------------
             habit_prompt_time = self.config.habit_prompt_time
-            habit_prompt_key = f"habit_prompt_{now.strftime('%Y-%m-%d')}"
+            habit_prompt_key = f"habit_prompt_{now.date().isoformat()}"
             if (
                 habit_prompt_time
                 and now_str == habit_prompt_time
                 and habit_prompt_key not in self.notified_today
-                and not self.config.should_skip_today()
+                and not skip_today
             ):
                 _log_runtime_event("Habit tracking popup triggered")
                 threading.Thread(target=show_habit_tracking_popup, daemon=True).start()
@@ -547,7 +874,7 @@ class ScheduleRunner:
             # -----------------------------------------------------------------
             # Urgent Tasks & Deadlines
             # -----------------------------------------------------------------
-            if not self.config.should_skip_today():
+            if not skip_today:
                 # Check urgent tasks
                 for urgent_time in self.config.daily_urgent_times:
                     urgent_tasks_key = f"urgent_tasks_{urgent_time}"
@@ -584,10 +911,10 @@ class ScheduleRunner:
                     if len(parts) == 2:
                         day_of_week, review_time = parts
                         if (
-                            now.strftime("%A").lower() == day_of_week.lower()
+                            weekday == day_of_week.lower()
                             and now_str == review_time
                         ):
-                            review_key = f"weekly_review_{now.strftime('%Y-%m-%d')}"
+                            review_key = f"weekly_review_{now.date().isoformat()}"
                             if review_key not in self.notified_today:
                                 threading.Thread(
                                     target=try_auto_generate_reports,
@@ -608,7 +935,7 @@ class ScheduleRunner:
                     if len(parts) == 2:
                         day_of_month, review_time = parts
                         if now.day == int(day_of_month) and now_str == review_time:
-                            review_key = f"monthly_review_{now.strftime('%Y-%m')}"
+                            review_key = f"monthly_review_{now.year:04d}-{now.month:02d}"
                             if review_key not in self.notified_today:
                                 threading.Thread(
                                     target=try_auto_generate_reports,
@@ -620,42 +947,14 @@ class ScheduleRunner:
                     pass
 
             # -----------------------------------------------------------------
-            # Skip if no schedule today
-            # -----------------------------------------------------------------
-            if not today_schedule:
-                time.sleep(20)
-                continue
-
-            # -----------------------------------------------------------------
-            # Handle Start Events
-            # -----------------------------------------------------------------
-            if current_mode == "j" and now_str in today_schedule and now_str not in self.notified_today:
-                self._handle_event(now_str, today_schedule[now_str])
-
-            # -----------------------------------------------------------------
-            # Handle End Alarms
-            # -----------------------------------------------------------------
-            if (
-                current_mode == "j"
-                and now_str in self.pending_end_alarms
-                and now_str not in self.notified_today
-            ):
-                message = self.pending_end_alarms[now_str]
-                _log_runtime_event(f"End alarm triggered at {now_str}: {message}")
-                self._trigger_alarm(_t("End Reminder"), message)
-                self.notified_today.add(now_str)
-                del self.pending_end_alarms[now_str]
-
-            # -----------------------------------------------------------------
-            # Midnight Reset
+            # Scheduled Start Events & End Alarms
             # -----------------------------------------------------------------
-            if now_str == "00:00":
-                _log_runtime_event("Midnight reset triggered")
-                self.notified_today.clear()
-                self.pending_end_alarms.clear()
+            if current_mode == "j":
+                self._dispatch_due_events(now_str, today_schedule)
 
-            # Sleep before next check
-            time.sleep(20)
+            # Sleep until the next minute with something to trigger
+            sleep = self._sleep or time.sleep
+            sleep(self._seconds_until_next_check(datetime.now(), today_schedule))
 
 
 # =============================================================================
@@ -681,6 +980,9 @@ def main() -> None:
         f"habit_prompt={config.habit_prompt_time}"
     )
     runner = ScheduleRunner(config, weekly)
+    if hasattr(signal, "SIGHUP"):
+        # `kill -HUP <pid>` reloads the TOML files without a restart
+        signal.signal(signal.SIGHUP, lambda signum, frame: runner.request_reload())
     runner.run()
 
 
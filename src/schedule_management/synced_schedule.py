@@ -19,6 +19,7 @@ from typing import Any
 import tomllib
 
 from schedule_management.config_layout import resolve_config_root_dir
+from schedule_management.time_utils import weekday_name
 
 SYNCABLE_BLOCKS = {"pomodoro", "potato"}
 
@@ -64,9 +65,6 @@ def _normalize_assignment(event: Any) -> dict[str, str] | None:
 def load_synced_schedule(path: Path | None = None) -> SyncedDaySchedule | None:
     """Load a synced overlay file if it exists and is valid."""
     target_path = path or resolve_synced_schedule_path()
-    if not target_path.exists():
-        return None
-
     try:
         with open(target_path, "rb") as handle:
             raw = tomllib.load(handle)
@@ -111,7 +109,7 @@ def synced_schedule_matches_today(
         return False
 
     actual_date = target_date or date.today()
-    expected_weekday = weekday or actual_date.strftime("%A").lower()
+    expected_weekday = weekday or weekday_name(actual_date)
 
     if synced.target_date != actual_date.isoformat():
         return False
@@ -6,7 +6,7 @@ in the schedule management system, including:
 - Parsing time strings ('HH:MM') to datetime.time objects
 - Converting time objects back to strings
 - Adding/subtracting minutes from time strings
-- Determining week parity (odd/even weeks)
+- Determining week parity (odd/even weeks) and weekday names
 - Repeating alarm functionality
 
 These utilities are used throughout the application for schedule
@@ -19,9 +19,47 @@ Example Usage:
 """
 
 import time as time_module
-from datetime import datetime, timedelta
+from collections.abc import Callable
+from datetime import date, datetime, time as dt_time
+from functools import lru_cache
 
-from schedule_management.platform import play_sound, show_dialog
+from schedule_management.platform import resolve_dialog, resolve_sound_player
+
+
+# =============================================================================
+# WEEKDAYS
+# =============================================================================
+
+# Lowercase weekday keys used by schedule files, indexed by date.weekday()
+WEEKDAY_NAMES = (
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+)
+
+
+def weekday_name(value: date) -> str:
+    """
+    Return the lowercase English weekday name for a date or datetime.
+
+    Unlike strftime('%A'), this does not depend on the process locale.
+
+    Args:
+        value: A date or datetime
+
+    Returns:
+        str: Weekday key such as 'monday'
+
+    Example:
+        >>> from datetime import date
+        >>> weekday_name(date(2026, 4, 8))
+        'wednesday'
+    """
+    return WEEKDAY_NAMES[value.weekday()]
 
 
 # =============================================================================
@@ -29,13 +67,17 @@ from schedule_management.platform import play_sound, show_dialog
 # =============================================================================
 
 
-def get_week_parity() -> str:
+def get_week_parity(today: date | None = None) -> str:
     """
     Determine whether the current ISO week number is odd or even.
 
     Uses ISO calendar week numbering where weeks start on Monday
     and the first week of the year contains January 4th.
 
+    Args:
+        today: Date to evaluate (default: the current date). Callers that
+            already hold today's date can pass it to skip the clock read.
+
     Returns:
         str: 'odd' if the current week number is odd, 'even' if even
 
@@ -48,7 +90,9 @@ def get_week_parity() -> str:
         This is useful for bi-weekly scheduling patterns (e.g., alternating
         class schedules, on-call rotations).
     """
-    week_number = datetime.now().isocalendar().week
+    if today is None:
+        today = datetime.now().date()
+    week_number = today.isocalendar().week
     return "odd" if week_number % 2 == 1 else "even"
 
 
@@ -57,6 +101,7 @@ def get_week_parity() -> str:
 # =============================================================================
 
 
+@lru_cache(maxsize=512)
 def parse_time(timestr: str) -> datetime.time:
     """
     Convert a time string in 'HH:MM' format to a datetime.time object.
@@ -70,11 +115,28 @@ def parse_time(timestr: str) -> datetime.time:
     Raises:
         ValueError: If timestr is not in valid 'HH:MM' format
 
+    Note:
+        Results are memoized, since schedules repeat the same time strings.
+        Plain 'H:MM'/'HH:MM' strings are converted directly; anything else
+        goes through strptime so errors match its behaviour.
+
     Example:
         >>> t = parse_time('09:30')
         >>> t.hour, t.minute
         (9, 30)
     """
+    hour_str, sep, minute_str = timestr.partition(":")
+    if (
+        sep
+        and 0 < len(hour_str) <= 2
+        and 0 < len(minute_str) <= 2
+        and hour_str.isascii()
+        and hour_str.isdigit()
+        and minute_str.isascii()
+        and minute_str.isdigit()
+    ):
+        # Out-of-range values raise ValueError, as strptime would
+        return dt_time(int(hour_str), int(minute_str))
     return datetime.strptime(timestr, "%H:%M").time()
 
 
@@ -93,7 +155,7 @@ def time_to_str(t: datetime.time) -> str:
         >>> time_to_str(time(14, 30))
         '14:30'
     """
-    return t.strftime("%H:%M")
+    return f"{t.hour:02d}:{t.minute:02d}"
 
 
 def add_minutes_to_time(timestr: str, minutes: int) -> str:
@@ -113,12 +175,21 @@ def add_minutes_to_time(timestr: str, minutes: int) -> str:
         >>> add_minutes_to_time('23:45', 30)
         '00:15'
 
+    Raises:
+        ValueError: If timestr is not in valid 'HH:MM' format
+
     Note:
         Handles day overflow (e.g., adding minutes past midnight).
     """
-    dt = datetime.strptime(timestr, "%H:%M")
-    new_dt = dt + timedelta(minutes=minutes)
-    return new_dt.strftime("%H:%M")
+    hour_str, sep, minute_str = timestr.partition(":")
+    if not sep or not hour_str.isdigit() or not minute_str.isdigit():
+        raise ValueError(f"time data {timestr!r} does not match format '%H:%M'")
+    hours, mins = int(hour_str), int(minute_str)
+    if hours > 23 or mins > 59:
+        raise ValueError(f"time data {timestr!r} does not match format '%H:%M'")
+
+    total = (hours * 60 + mins + minutes) % (24 * 60)
+    return f"{total // 60:02d}:{total % 60:02d}"
 
 
 # =============================================================================
@@ -132,6 +203,9 @@ def alarm(
     sound_file: str,
     alarm_interval: int,
     max_alarm_duration: int,
+    *,
+    clock: Callable[[], float] = time_module.time,
+    sleep: Callable[[float], None] = time_module.sleep,
 ) -> None:
     """
     Trigger a repeating alarm until dismissed or timeout.
@@ -145,6 +219,8 @@ def alarm(
         sound_file: Path to the sound file to play
         alarm_interval: Seconds between alarm repetitions
         max_alarm_duration: Maximum total seconds to alarm before auto-stop
+        clock: Function returning the current time in seconds
+        sleep: Function used to wait between repetitions
 
     Example:
         >>> alarm(
@@ -159,13 +235,27 @@ def alarm(
         The alarm stops when:
         1. User clicks '停止闹铃' (Stop Alarm) button
         2. max_alarm_duration seconds have elapsed
+
+        A still-playing sound is reused rather than respawned on each
+        repetition, and is stopped when the alarm ends.
     """
-    start_time = time_module.time()
-    while True:
-        play_sound(sound_file)
-        button = show_dialog(message)
-        if "停止闘铃" in button or "停止闹铃" in button:
-            break
-        if time_module.time() - start_time > max_alarm_duration:
-            break
-        time_module.sleep(alarm_interval)
+    # Resolve the platform backends once for all repetitions
+    play_sound = resolve_sound_player()
+    show_dialog = resolve_dialog()
+
+    start_time = clock()
+    player = None
+    try:
+        while True:
+            # Only start a new player once the previous sound has finished
+            if player is None or player.poll() is not None:
+                player = play_sound(sound_file)
+            button = show_dialog(message)
+            if "停止闘铃" in button or "停止闹铃" in button:
+                break
+            if clock() - start_time > max_alarm_duration:
+                break
+            sleep(alarm_interval)
+    finally:
+        if player is not None and player.poll() is None:
+            player.terminate()
@@ -193,6 +193,28 @@ class TestSwitchCommand:
         assert "Valid config ids: 0, 2" in printed
 
 
+class TestEditCommand:
+    """Test the edit command's editor discovery."""
+
+    def test_edit_falls_back_to_first_installed_editor(self, monkeypatch, tmp_path):
+        import schedule_management.commands.service as service_commands
+
+        settings_path = tmp_path / "settings.toml"
+        settings_path.write_text("", encoding="utf-8")
+        monkeypatch.setattr(service_commands, "SETTINGS_PATH", str(settings_path))
+        monkeypatch.delenv("EDITOR", raising=False)
+        monkeypatch.delenv("VISUAL", raising=False)
+
+        installed = {"nano": "/usr/bin/nano", "vi": "/usr/bin/vi"}
+        with patch.object(
+            service_commands.shutil, "which", side_effect=installed.get
+        ), patch.object(service_commands.subprocess, "run") as mock_run:
+            result = service_commands.edit_schedule_command(MagicMock(file="settings"))
+
+        assert result == 0
+        mock_run.assert_called_once_with(["nano", str(settings_path)], check=False)
+
+
 class TestReportCommand:
     """Test the manual report command."""
 
@@ -264,7 +286,7 @@ class TestViewCommand:
     @patch("schedule_management.commands.status._schedule_visualizer_class")
     @patch("schedule_management.commands.status.WeeklySchedule")
     @patch("schedule_management.commands.status.ScheduleConfig")
-    @patch("schedule_management.commands.status.subprocess.run")
+    @patch("schedule_management.commands.status.subprocess.Popen")
     def test_view_success(
         self, mock_subprocess, mock_config, mock_weekly, mock_visualizer_class
     ):
@@ -286,6 +308,61 @@ class TestViewCommand:
         assert result == 0
         mock_visualizer_instance.visualize.assert_called_once()
 
+    @patch("schedule_management.commands.status._schedule_visualizer_class")
+    def test_view_skips_rendering_when_pdf_is_current(
+        self, mock_visualizer_class, tmp_path, monkeypatch
+    ):
+        """An up-to-date PDF is reused unless --force is passed."""
+        import os
+
+        import schedule_management.commands.status as status_module
+
+        sources = []
+        for name in ("settings.toml", "odd_weeks.toml", "even_weeks.toml"):
+            source = tmp_path / name
+            source.write_text("", encoding="utf-8")
+            os.utime(source, ns=(1_000_000_000, 1_000_000_000))
+            sources.append(str(source))
+        monkeypatch.setattr(status_module, "SETTINGS_PATH", sources[0])
+        monkeypatch.setattr(status_module, "ODD_PATH", sources[1])
+        monkeypatch.setattr(status_module, "EVEN_PATH", sources[2])
+        monkeypatch.setattr(status_module.Path, "home", lambda: tmp_path)
+        (tmp_path / "Desktop").mkdir()
+        (tmp_path / "Desktop" / "schedule_visualization.pdf").write_bytes(b"%PDF")
+
+        with patch("schedule_management.commands.status.ScheduleConfig"), patch(
+            "schedule_management.commands.status.WeeklySchedule"
+        ):
+            assert reminder.view_command(MagicMock(force=False)) == 0
+            mock_visualizer_class.assert_not_called()
+
+            assert reminder.view_command(MagicMock(force=True)) == 0
+            mock_visualizer_class.assert_called_once()
+
+        # Editing a schedule file makes the PDF stale again
+        os.utime(sources[1], None)
+        os.utime(tmp_path / "Desktop" / "schedule_visualization.pdf", ns=(2_000_000_000, 2_000_000_000))
+        assert not status_module._visualization_is_current(
+            tmp_path / "Desktop" / "schedule_visualization.pdf"
+        )
+
+    @patch("schedule_management.commands.status._schedule_visualizer_class")
+    @patch("schedule_management.commands.status.WeeklySchedule")
+    @patch("schedule_management.commands.status.ScheduleConfig")
+    @patch("schedule_management.commands.status.subprocess.Popen")
+    def test_view_opens_pdf_once_without_waiting_on_macos(
+        self, mock_popen, mock_config, mock_weekly, mock_visualizer_class
+    ):
+        """On macOS the PDF is handed to a single non-blocking `open` call."""
+        with patch("schedule_management.commands.status.sys.platform", "darwin"):
+            result = reminder.view_command(MagicMock())
+
+        assert result == 0
+        mock_popen.assert_called_once()
+        command = mock_popen.call_args.args[0]
+        assert command[0] == "open"
+        assert command[1].endswith("schedule_visualization.pdf")
+
     @patch("schedule_management.commands.status._schedule_visualizer_class")
     @patch("schedule_management.commands.status.WeeklySchedule")
     @patch("schedule_management.commands.status.ScheduleConfig")
@@ -343,6 +420,28 @@ class TestStatusCommand:
         odd_week_found = any("Odd Week" in call for call in print_calls)
         assert odd_week_found, f"Expected 'Odd Week' in print calls, got: {print_calls}"
 
+    @patch("schedule_management.commands.status.Table")
+    @patch("schedule_management.commands.status.get_today_schedule_for_status")
+    @patch("schedule_management.commands.status.Console")
+    def test_status_verbose_orders_rows_by_parsed_time(
+        self, mock_console_class, mock_get_schedule, mock_table_class
+    ):
+        """Verbose rows follow clock order; unparseable keys land in the evening."""
+        mock_get_schedule.return_value = (
+            {"10:00": "reading", "bad": "mystery", "9:05": "pomodoro", "13:00": "lunch"},
+            "even",
+            False,
+            MagicMock(time_blocks={"pomodoro": 25}, time_points={}),
+        )
+        mock_table = MagicMock()
+        mock_table_class.return_value = mock_table
+
+        result = reminder.status_command(MagicMock(verbose=True))
+
+        assert result == 0
+        row_times = [call.args[0] for call in mock_table.add_row.call_args_list]
+        assert [t for t in row_times if t[0].isalnum()] == ["9:05", "10:00", "13:00", "bad"]
+
     @patch("schedule_management.commands.status.get_today_schedule_for_status")
     @patch("schedule_management.commands.status.Console")
     def test_status_skip_day(self, mock_console_class, mock_get_schedule):
@@ -598,6 +697,60 @@ class TestHelperFunctions:
         assert next_event == "pomodoro: Finish proposal draft at 10:00"
         assert time_to_next == "30m"
 
+    def test_format_activity_cell_styles_by_block_type(self):
+        """Verbose status rows pick their icon and style from the block name."""
+        from schedule_management.commands.status import _format_activity_cell
+
+        assert _format_activity_cell("Coffee Break", "misc") == "☕  [italic dim]Coffee Break[/italic dim]"
+        assert _format_activity_cell("pomodoro: Write", "Pomodoro") == "🍅  [bold red]pomodoro: Write[/bold red]"
+        assert _format_activity_cell("Sleep", "go_to_bed") == "🌙  [bold blue]Sleep[/bold blue]"
+        assert _format_activity_cell("Read", "Read") == "•  [bold]Read[/bold]"
+
+    @patch("schedule_management.commands.status.datetime")
+    def test_get_current_and_next_events_reports_active_block(self, mock_datetime):
+        """An active block is current while the next event counts down."""
+        mock_now = MagicMock()
+        mock_now.time.return_value = time(9, 10, 30)
+        mock_datetime.now.return_value = mock_now
+
+        current, next_event, time_to_next = reminder.get_current_and_next_events(
+            {"11:30": "lunch", "09:00": "pomodoro", "bad": "ignored"},
+            MagicMock(time_blocks={"pomodoro": 25}, time_points={}),
+        )
+
+        assert current == "pomodoro at 09:00"
+        assert next_event == "lunch at 11:30"
+        assert time_to_next == "2h 19m"
+
+    @patch("schedule_management.commands.status.datetime")
+    def test_get_current_and_next_events_keeps_block_after_point_ends(self, mock_datetime):
+        """A long block stays current once a time point inside it has passed."""
+        mock_now = MagicMock()
+        mock_now.time.return_value = time(9, 40)
+        mock_datetime.now.return_value = mock_now
+
+        current, next_event, time_to_next = reminder.get_current_and_next_events(
+            {"09:00": "deep_work", "09:30": "drink water", "10:00": "lunch"},
+            MagicMock(time_blocks={"deep_work": 90}, time_points={}),
+        )
+
+        assert current == "deep_work at 09:00"
+        assert next_event == "lunch at 10:00"
+        assert time_to_next == "20m"
+
+    def test_get_current_and_next_events_uses_given_now(self):
+        """A caller-supplied now is used instead of reading the clock."""
+        from schedule_management.commands.status import get_current_and_next_events
+
+        current, next_event, time_to_next = get_current_and_next_events(
+            {"08:00": "breakfast", "12:00": "lunch"},
+            now=datetime(2024, 1, 1, 10, 15),
+        )
+
+        assert current is None
+        assert next_event == "lunch at 12:00"
+        assert time_to_next == "1h 45m"
+
     @patch("schedule_management.commands.status.ScheduleConfig")
     @patch("schedule_management.commands.status.WeeklySchedule")
     @patch("schedule_management.commands.status.get_week_parity")
@@ -807,6 +960,29 @@ class TestCompletionCommand:
         assert args.command == "completion"
         assert args.shell == "bash"
 
+    def test_fast_path_matches_full_parser(self):
+        """Hot commands skip argparse but produce the same namespace."""
+        from schedule_management.cli import _fast_path_args
+
+        parser = reminder.create_parser()
+        for argv in (["ls"], ["status"], ["status", "-v"], ["status", "--verbose"]):
+            assert _fast_path_args(argv) == parser.parse_args(argv)
+
+        for argv in ([], ["ls", "-h"], ["status", "-x"], ["add", "x", "5"]):
+            assert _fast_path_args(argv) is None
+
+    @patch("schedule_management.cli.preview_active_config_dir")
+    def test_create_parser_resolves_config_only_for_help(self, mock_preview):
+        """The config-location epilog is built when help is shown, not on parse."""
+        mock_preview.return_value = Path("/tmp/rmd-config/user_config_3")
+        parser = reminder.create_parser()
+
+        parser.parse_args(["ls"])
+        mock_preview.assert_not_called()
+
+        assert "user_config_3" in parser.format_help()
+        mock_preview.assert_called_once()
+
     def test_create_parser_with_switch_command(self):
         """Test parser wiring for the switch command."""
         parser = reminder.create_parser()
@@ -1334,6 +1510,30 @@ class TestTaskManagement:
         # Low priority task should still be there
         assert any(t["description"] == "Low priority task" for t in saved_tasks)
 
+    @patch("schedule_management.commands.tasks.load_tasks")
+    @patch("schedule_management.commands.tasks.save_tasks")
+    def test_delete_task_mixed_ids_and_repeated_description(
+        self, mock_save_tasks, mock_load_tasks
+    ):
+        """IDs stay tied to the listing and a repeated target is reported missing."""
+        mock_load_tasks.return_value = [
+            {"description": "High priority task", "priority": 9},
+            {"description": "Medium priority task", "priority": 5},
+            {"description": "Low priority task", "priority": 2},
+        ]
+
+        args = MagicMock()
+        args.tasks = ["3", "High priority task", "1"]
+
+        with patch("builtins.print") as mock_print:
+            result = reminder.delete_task(args)
+
+        assert result == 1
+        assert mock_save_tasks.call_args[0][0] == [
+            {"description": "Medium priority task", "priority": 5}
+        ]
+        mock_print.assert_any_call("❌ Task 'High priority task' not found")
+
     @patch("schedule_management.commands.tasks.load_tasks")
     @patch("schedule_management.commands.tasks.save_tasks")
     def test_delete_task_by_id_first_item(self, mock_save_tasks, mock_load_tasks):
@@ -1804,6 +2004,74 @@ class TestTaskManagement:
         ]
         assert len(total_calls) > 0, "Expected total tasks count to be printed"
 
+    def test_batch_tasks_applies_operations_with_one_save(self, tmp_path, monkeypatch, capsys):
+        """rmd batch applies add/rm lines together and syncs the procrastinate list."""
+        import io
+
+        from schedule_management.commands.tasks import batch_tasks
+
+        import schedule_management.data.loaders as data_loaders
+
+        monkeypatch.setattr(data_loaders, "TASKS_PATH", str(tmp_path / "tasks.json"))
+        monkeypatch.setattr(data_loaders, "PROCRASTINATE_PATH", str(tmp_path / "procrastinate.json"))
+        data_loaders.save_tasks([{"description": "Laundry", "priority": 4}])
+        data_loaders.save_procrastinate_list({"Laundry"})
+
+        ops = io.StringIO(
+            '# weekly planning\n'
+            '{"op": "add", "task": "Study", "priority": 8, "postpone": 1}\n'
+            '\n'
+            '{"op": "rm", "task": "Laundry"}\n'
+            '{"op": "rm", "task": "Ghost"}\n'
+        )
+        with patch("schedule_management.commands.tasks.save_tasks") as mock_save:
+            mock_save.side_effect = AssertionError("batch must not use per-command saves")
+            result = batch_tasks(MagicMock(file=ops))
+
+        assert result == 1
+        tasks = data_loaders.load_tasks()
+        assert [task["description"] for task in tasks] == ["Study"]
+        assert "alarm_from" in tasks[0]
+        assert data_loaders.load_procrastinate_list() == set()
+        out = capsys.readouterr().out
+        assert "Task 'Ghost' not found" in out
+        assert "1 added, 0 updated, 1 deleted" in out
+
+    def test_batch_tasks_rejects_invalid_lines_without_changes(self, capsys):
+        """Any invalid line aborts the whole batch before touching the task list."""
+        import io
+
+        from schedule_management.commands.tasks import batch_tasks
+
+        ops = io.StringIO('{"op": "add", "task": "Study", "priority": 8}\n{"op": "add", "task": "X"}\nnot json\n')
+        with patch("schedule_management.commands.tasks.TasksDB") as mock_db:
+            result = batch_tasks(MagicMock(file=ops))
+
+        assert result == 1
+        mock_db.assert_not_called()
+        out = capsys.readouterr().out
+        assert "Line 2: 'priority' must be a positive integer" in out
+        assert "Line 3: invalid JSON" in out
+
+    @patch("schedule_management.commands.tasks.load_procrastinate_records", return_value={})
+    @patch("schedule_management.commands.tasks.load_tasks")
+    def test_show_tasks_prints_plain_rows_when_piped(self, mock_load_tasks, _mock_records, capsys):
+        """Non-terminal output skips the table and prints tab-separated rows."""
+        mock_load_tasks.return_value = [
+            {"description": "Low", "priority": 2},
+            {"description": "High", "priority": 9},
+        ]
+
+        with patch("schedule_management.commands.tasks.Console") as mock_console_class:
+            mock_console = MagicMock(is_terminal=False)
+            mock_console_class.return_value = mock_console
+
+            result = reminder.show_tasks(MagicMock())
+
+        assert result == 0
+        mock_console.print.assert_not_called()
+        assert capsys.readouterr().out == "1\t9\tHigh\n2\t2\tLow\n"
+
     @patch("schedule_management.commands.tasks.load_tasks")
     @patch("schedule_management.commands.tasks.load_procrastinate_records")
     @patch("schedule_management.commands.tasks.Table")
@@ -1981,7 +2249,40 @@ class TestTaskManagement:
         assert added_rows[5] == "💤 Task 6 (inc 2) (2 days left)"
 
 
-    @patch("schedule_management.commands.tasks.log_task_action")
+    def test_priority_bar_uses_prebuilt_styles(self):
+        """The priority cell is styled text with the bar clamped to 10 blocks."""
+        from schedule_management.commands.tasks import _format_priority_bar
+
+        high = _format_priority_bar(12)
+        low = _format_priority_bar(3)
+
+        assert high.plain == "██████████ (12)"
+        assert str(high.style) == "red"
+        assert low.plain == "███░░░░░░░ (3)"
+        assert str(low.style) == "blue"
+        assert [str(span.style) for span in low.spans] == ["dim blue", "blue"]
+
+    def test_days_until_alarm_tolerates_missing_and_malformed_dates(self):
+        """Postponement days are computed once per task; bad dates count as current."""
+        from datetime import date
+
+        from schedule_management.commands.tasks import (
+            _days_until_alarm,
+            _sort_tasks_by_section_and_priority,
+        )
+
+        today = date(2026, 3, 10)
+        tasks = [
+            {"description": "bad", "priority": 1, "alarm_from": "not-a-date"},
+            {"description": "later", "priority": 9, "alarm_from": "2026-03-12"},
+            {"description": "now", "priority": 5},
+        ]
+
+        assert [_days_until_alarm(t, today) for t in tasks] == [0, 2, 0]
+        ordered = _sort_tasks_by_section_and_priority(tasks, today, set())
+        assert [t["description"] for t in ordered] == ["now", "bad", "later"]
+
+    @patch("schedule_management.commands.tasks.log_task_actions")
     @patch("schedule_management.commands.tasks.save_procrastinate_list")
     @patch("schedule_management.commands.tasks.load_procrastinate_list")
     @patch("schedule_management.commands.tasks.save_tasks")
@@ -1992,7 +2293,7 @@ class TestTaskManagement:
         mock_save_tasks,
         mock_load_procrastinate_list,
         mock_save_procrastinate_list,
-        mock_log_task_action,
+        mock_log_task_actions,
     ):
         """Test that deleting a task also removes it from procrastinate list."""
         mock_load_tasks.return_value = [
@@ -2008,7 +2309,9 @@ class TestTaskManagement:
         result = reminder.delete_task(args)
 
         assert result == 0
-        mock_log_task_action.assert_called_once()
+        mock_log_task_actions.assert_called_once_with(
+            "deleted", [{"description": "Review code", "priority": 9}]
+        )
         mock_save_tasks.assert_called_once()
         mock_save_procrastinate_list.assert_called_once()
 
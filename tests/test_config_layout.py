@@ -61,3 +61,25 @@ def test_clone_active_config_dir_copies_current_config_set(tmp_path):
     assert (new_config_dir / "settings.toml").read_text(encoding="utf-8") == "[settings]\n"
     assert (new_config_dir / "profile.md").read_text(encoding="utf-8") == "# Draft\n"
     assert (new_config_dir / "ddl.json").read_text(encoding="utf-8") == "{}\n"
+
+
+def test_resolve_runtime_paths_reuses_result_until_layout_changes(tmp_path, monkeypatch):
+    config_root = tmp_path / "config"
+    _write(config_root / "user_config_0" / "settings.toml", "[settings]\n")
+    write_active_config_id(config_root, 0)
+
+    first = resolve_runtime_paths(config_root)
+
+    def fail_scan(root_dir):
+        raise AssertionError("layout should not be rescanned")
+
+    monkeypatch.setattr("schedule_management.config_layout._discover_config_dirs", fail_scan)
+    assert resolve_runtime_paths(config_root) is first
+    monkeypatch.undo()
+
+    new_config_id, new_config_dir = clone_active_config_dir(config_root)
+    write_active_config_id(config_root, new_config_id)
+
+    switched = resolve_runtime_paths(config_root)
+    assert switched.active_id == 1
+    assert switched.settings_path == new_config_dir / "settings.toml"
@@ -0,0 +1,256 @@
+"""Tests for the task data loaders: read cache, atomic saves and task log."""
+
+from unittest.mock import patch
+
+import pytest
+
+
+class TestTaskDataLoaders:
+    def test_load_tasks_reuses_parsed_file_until_it_changes(
+        self, tmp_path, monkeypatch
+    ):
+        import json
+
+        import schedule_management.data.loaders as data_loaders
+
+        tasks_path = tmp_path / "tasks.json"
+        tasks_path.write_text(
+            json.dumps([{"description": "Study", "priority": 5}]), encoding="utf-8"
+        )
+        monkeypatch.setattr(data_loaders, "TASKS_PATH", str(tasks_path))
+
+        first = data_loaders.load_tasks()
+        first[0]["priority"] = 9  # Callers get copies, not the cached records
+        with patch.object(data_loaders.json, "load") as mock_load:
+            assert data_loaders.load_tasks() == [
+                {"description": "Study", "priority": 5}
+            ]
+        mock_load.assert_not_called()
+
+        tasks_path.write_text(
+            json.dumps([{"description": "Study more", "priority": 7}]),
+            encoding="utf-8",
+        )
+        assert data_loaders.load_tasks() == [
+            {"description": "Study more", "priority": 7}
+        ]
+
+    def test_save_tasks_refreshes_read_cache(self, tmp_path, monkeypatch):
+        import schedule_management.data.loaders as data_loaders
+
+        tasks_path = tmp_path / "nested" / "tasks.json"
+        monkeypatch.setattr(data_loaders, "TASKS_PATH", str(tasks_path))
+
+        data_loaders.save_tasks([{"description": "Write", "priority": 3}])
+
+        with patch.object(data_loaders.json, "load") as mock_load:
+            assert data_loaders.load_tasks() == [
+                {"description": "Write", "priority": 3}
+            ]
+        mock_load.assert_not_called()
+
+    def test_save_tasks_keeps_previous_file_when_write_fails(
+        self, tmp_path, monkeypatch
+    ):
+        import json
+
+        import schedule_management.data.loaders as data_loaders
+
+        tasks_path = tmp_path / "tasks.json"
+        monkeypatch.setattr(data_loaders, "TASKS_PATH", str(tasks_path))
+        data_loaders.save_tasks([{"description": "Keep", "priority": 1}])
+        assert tasks_path.stat().st_mode & 0o777 == data_loaders._NEW_FILE_MODE
+
+        with patch.object(data_loaders.os, "fsync", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                data_loaders.save_tasks([{"description": "Lost", "priority": 2}])
+
+        assert json.loads(tasks_path.read_text(encoding="utf-8")) == [
+            {"description": "Keep", "priority": 1}
+        ]
+        assert list(tmp_path.iterdir()) == [tasks_path]
+
+    def test_tasks_db_saves_once_and_only_on_success(self, tmp_path, monkeypatch):
+        import json
+
+        import schedule_management.data.loaders as data_loaders
+
+        tasks_path = tmp_path / "tasks.json"
+        log_path = tmp_path / "tasks.log"
+        monkeypatch.setattr(data_loaders, "TASKS_PATH", str(tasks_path))
+        monkeypatch.setattr(data_loaders, "TASK_LOG_PATH", str(log_path))
+        data_loaders.save_tasks([{"description": "Old", "priority": 2}])
+
+        with patch.object(data_loaders, "save_tasks", wraps=data_loaders.save_tasks) as save:
+            with data_loaders.TasksDB() as db:
+                assert db.add("New", 5) is None
+                assert db.add("Old", 7) == 2
+                assert db.delete("Missing") == []
+                assert db.delete("New") == [{"description": "New", "priority": 5}]
+            save.assert_called_once()
+
+        assert json.loads(tasks_path.read_text(encoding="utf-8")) == [
+            {"description": "Old", "priority": 7}
+        ]
+        actions = [json.loads(line)["action"] for line in log_path.read_text(encoding="utf-8").splitlines()]
+        assert actions == ["added", "updated", "deleted"]
+
+        with pytest.raises(RuntimeError):
+            with data_loaders.TasksDB() as db:
+                db.add("Discarded", 1)
+                raise RuntimeError("abort")
+        assert [task["description"] for task in data_loaders.load_tasks()] == ["Old"]
+
+    def test_tasks_db_index_follows_deletions(self, tmp_path, monkeypatch):
+        import schedule_management.data.loaders as data_loaders
+
+        monkeypatch.setattr(data_loaders, "TASKS_PATH", str(tmp_path / "tasks.json"))
+        monkeypatch.setattr(data_loaders, "TASK_LOG_PATH", str(tmp_path / "tasks.log"))
+        data_loaders.save_tasks(
+            [{"description": "A", "priority": 1}, {"description": "B", "priority": 2}]
+        )
+
+        with data_loaders.TasksDB() as db:
+            db.delete("A")
+            assert db.add("B", 5) == 2
+            assert db.add("C", 3) is None
+            assert db.add("C", 4) == 3
+
+        assert data_loaders.load_tasks() == [
+            {"description": "B", "priority": 5},
+            {"description": "C", "priority": 4},
+        ]
+
+    def test_log_task_action_appends_json_lines(self, tmp_path, monkeypatch):
+        import json
+
+        import schedule_management.data.loaders as data_loaders
+
+        log_path = tmp_path / "tasks.log"
+        monkeypatch.setattr(data_loaders, "TASK_LOG_PATH", str(log_path))
+
+        data_loaders.log_task_action("added", {"description": "A", "priority": 1})
+        assert data_loaders.load_task_log()[-1]["action"] == "added"
+        data_loaders.log_task_action("deleted", {"description": "A", "priority": 1})
+
+        lines = log_path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["action"] for line in lines] == ["added", "deleted"]
+        assert [entry["action"] for entry in data_loaders.load_task_log()] == [
+            "added",
+            "deleted",
+        ]
+
+    def test_log_task_actions_writes_all_entries_at_once(self, tmp_path, monkeypatch):
+        import builtins
+        import json
+
+        import schedule_management.data.loaders as data_loaders
+
+        log_path = tmp_path / "tasks.log"
+        monkeypatch.setattr(data_loaders, "TASK_LOG_PATH", str(log_path))
+        tasks = [{"description": "A", "priority": 1}, {"description": "B", "priority": 2}]
+
+        with patch.object(builtins, "open", wraps=builtins.open) as mock_open:
+            data_loaders.log_task_actions("deleted", tasks)
+
+        append_calls = [c for c in mock_open.call_args_list if c.args[1:2] == ("a",)]
+        assert len(append_calls) == 1
+        lines = log_path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["task"] for line in lines] == tasks
+
+    def test_append_task_log_entry_migrates_legacy_array(self, tmp_path, monkeypatch):
+        import json
+
+        import schedule_management.data.loaders as data_loaders
+
+        log_path = tmp_path / "tasks.log"
+        log_path.write_text(
+            json.dumps([{"action": "added", "task": {"description": "Old"}}], indent=2),
+            encoding="utf-8",
+        )
+        monkeypatch.setattr(data_loaders, "TASK_LOG_PATH", str(log_path))
+
+        assert data_loaders.load_task_log()[0]["task"]["description"] == "Old"
+        data_loaders.append_task_log_entry({"action": "deleted", "task": {}})
+
+        lines = log_path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["action"] for line in lines] == ["added", "deleted"]
+
+    def test_append_task_log_entry_moves_corrupt_legacy_array_aside(
+        self, tmp_path, monkeypatch
+    ):
+        import json
+
+        import schedule_management.data.loaders as data_loaders
+
+        log_path = tmp_path / "tasks.log"
+        log_path.write_text('[{"action": "added",', encoding="utf-8")
+        monkeypatch.setattr(data_loaders, "TASK_LOG_PATH", str(log_path))
+
+        data_loaders.append_task_log_entry({"action": "deleted", "task": {}})
+
+        lines = log_path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["action"] for line in lines] == ["deleted"]
+        (corrupt_path,) = tmp_path.glob("tasks.log.corrupt-*")
+        assert corrupt_path.read_text(encoding="utf-8") == '[{"action": "added",'
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            data_loaders.append_task_log_entry({"action": "added", "task": {}})
+        assert mock_open.call_count == 1
+
+    def test_iter_task_log_streams_both_directions(self, tmp_path, monkeypatch):
+        import json
+
+        import schedule_management.data.loaders as data_loaders
+
+        entries = [{"action": "added", "task": {"description": f"任务 {i}"}} for i in range(20)]
+        log_path = tmp_path / "tasks.log"
+        log_path.write_text(
+            "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries),
+            encoding="utf-8",
+        )
+        monkeypatch.setattr(data_loaders, "TASK_LOG_PATH", str(log_path))
+
+        assert list(data_loaders.iter_task_log()) == entries
+        # Small chunks split lines and multi-byte characters across reads
+        assert list(data_loaders.iter_task_log_reversed(chunk_size=7)) == entries[::-1]
+
+        log_path.write_text(json.dumps(entries[:2], indent=2), encoding="utf-8")
+        assert list(data_loaders.iter_task_log()) == entries[:2]
+        assert list(data_loaders.iter_task_log_reversed()) == entries[1::-1]
+
+    def test_get_today_completed_tasks_reads_only_recent_entries(
+        self, tmp_path, monkeypatch
+    ):
+        import json
+        from datetime import datetime
+
+        import schedule_management.data.loaders as data_loaders
+        import schedule_management.popups as popups
+
+        today = datetime.now().strftime("%Y-%m-%d")
+        log_path = tmp_path / "tasks.log"
+        log_path.write_text(
+            "\n".join(
+                json.dumps(entry)
+                for entry in [
+                    {"timestamp": "2000-01-01T08:00:00", "action": "deleted", "task": {"description": "Old"}},
+                    {"timestamp": f"{today}T08:00:00", "action": "deleted", "task": {"description": "A"}},
+                    {"timestamp": f"{today}T09:00:00", "action": "added", "task": {"description": "B"}},
+                    {"timestamp": f"{today}T10:00:00", "action": "deleted", "task": {"description": "B"}},
+                ]
+            ),
+            encoding="utf-8",
+        )
+        monkeypatch.setattr(data_loaders, "TASK_LOG_PATH", str(log_path))
+
+        completed = popups.get_today_completed_tasks()
+
+        assert completed == [{"description": "A"}, {"description": "B"}]
+
+    def test_parse_task_log_skips_blank_and_partial_lines(self):
+        from schedule_management.data import parse_task_log
+
+        text = '{"action": "added"}\n\n{"action": "deleted"}\n{"action": "upd'
+
+        assert parse_task_log(text) == [{"action": "added"}, {"action": "deleted"}]
@@ -269,6 +269,29 @@ class TestDeleteDeadline:
         assert len(saved_deadlines) == 1
         assert saved_deadlines[0]["event"] == "project"
 
+    @patch("schedule_management.commands.deadlines.save_deadlines")
+    @patch("schedule_management.commands.deadlines.load_deadlines")
+    def test_delete_deadline_removes_duplicates_once(self, mock_load, mock_save):
+        """All deadlines sharing a name go at once; repeating the name fails."""
+        mock_load.return_value = [
+            {"event": "exam", "deadline": "2026-03-15", "added": "2025-11-22T12:00:00Z"},
+            {"event": "project", "deadline": "2025-12-25", "added": "2025-11-22T11:00:00Z"},
+            {"event": "exam", "deadline": "2026-06-15", "added": "2025-11-22T13:00:00Z"},
+        ]
+
+        args = MagicMock()
+        args.events = ["exam", "exam"]
+
+        with patch("builtins.print") as mock_print:
+            result = reminder.delete_deadline(args)
+
+        assert result == 1
+        mock_save.assert_called_once()
+        assert [ddl["event"] for ddl in mock_save.call_args[0][0]] == ["project"]
+        calls = [str(call) for call in mock_print.call_args_list]
+        assert any("2 deadlines with name 'exam'" in call for call in calls)
+        assert any("not found" in call for call in calls)
+
     @patch("schedule_management.commands.deadlines.load_deadlines")
     def test_delete_deadline_not_found(self, mock_load):
         """Test deleting a non-existent deadline."""
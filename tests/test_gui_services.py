@@ -54,7 +54,10 @@ def test_task_add_updates_existing_task_and_logs(monkeypatch, tmp_path):
     assert json.loads(tasks_path.read_text(encoding="utf-8")) == [
         {"description": "Draft proposal", "priority": 9}
     ]
-    log = json.loads(task_log_path.read_text(encoding="utf-8"))
+    log = [
+        json.loads(line)
+        for line in task_log_path.read_text(encoding="utf-8").splitlines()
+    ]
     assert log[-1]["action"] == "updated"
 
 
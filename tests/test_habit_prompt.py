@@ -2,6 +2,7 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+import schedule_management.data.loaders as data_loaders
 import schedule_management.popups as popups
 
 
@@ -15,7 +16,7 @@ def test_show_habit_tracking_popup_saves_record(tmp_path, monkeypatch):
     record_path.parent.mkdir(parents=True, exist_ok=True)
 
     monkeypatch.setattr(popups, "HABIT_PATH", str(habits_path))
-    monkeypatch.setattr(popups, "RECORD_PATH", str(record_path))
+    monkeypatch.setattr(data_loaders, "RECORD_PATH", str(record_path))
 
     # Mock ask_yes_no to return True for first habit, False for second
     call_count = [0]
@@ -58,7 +59,7 @@ def test_show_habit_tracking_popup_cancel_does_not_save(tmp_path, monkeypatch):
     record_path.parent.mkdir(parents=True, exist_ok=True)
 
     monkeypatch.setattr(popups, "HABIT_PATH", str(habits_path))
-    monkeypatch.setattr(popups, "RECORD_PATH", str(record_path))
+    monkeypatch.setattr(data_loaders, "RECORD_PATH", str(record_path))
 
     # Mock ask_yes_no to return None (user cancelled)
     monkeypatch.setattr(popups, "ask_yes_no", lambda question, title: None)
@@ -19,3 +19,95 @@ def test_get_platform_detects_windows(monkeypatch):
 def test_get_platform_handles_unknown_values(monkeypatch):
     monkeypatch.setattr(platform_utils.sys, "platform", "plan9")
     assert platform_utils.get_platform() == "unknown"
+
+
+def test_resolve_backends_follow_detected_platform(monkeypatch):
+    monkeypatch.setattr(platform_utils.sys, "platform", "darwin")
+    assert platform_utils.resolve_sound_player() is platform_utils.play_sound_macos
+    assert platform_utils.resolve_dialog() is platform_utils.show_dialog_macos
+
+    monkeypatch.setattr(platform_utils.sys, "platform", "linux")
+    assert platform_utils.resolve_sound_player() is platform_utils.play_sound_linux
+    assert platform_utils.resolve_dialog() is platform_utils.show_dialog_linux
+
+
+def test_show_dialog_unsupported_platform_returns_ok(monkeypatch, capsys):
+    monkeypatch.setattr(platform_utils.sys, "platform", "plan9")
+    assert platform_utils.show_dialog("hello") == "OK"
+    assert "not supported on unknown" in capsys.readouterr().out
+
+
+def test_show_dialog_macos_passes_message_as_argument(monkeypatch):
+    calls = []
+
+    class _Result:
+        stdout = "button returned:停止闹铃\n"
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        assert kwargs["stderr"] is platform_utils.subprocess.DEVNULL
+        return _Result()
+
+    monkeypatch.setattr(platform_utils.subprocess, "run", fake_run)
+    monkeypatch.setattr(
+        platform_utils,
+        "_alarm_dialog_command",
+        lambda: platform_utils._ALARM_DIALOG_COMMAND,
+    )
+    message = 'Say "hi" \\ then rest'
+
+    assert platform_utils.show_dialog_macos(message) == "button returned:停止闹铃"
+    assert calls[0][-1] == message
+    assert all(message not in arg for arg in calls[0][:-1])
+
+
+def test_alarm_dialog_command_uses_compiled_script(monkeypatch):
+    calls = []
+
+    class _Result:
+        returncode = 0
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return _Result()
+
+    monkeypatch.setattr(platform_utils.subprocess, "run", fake_run)
+    platform_utils._alarm_dialog_command.cache_clear()
+    try:
+        command = platform_utils._alarm_dialog_command()
+        assert platform_utils._alarm_dialog_command() is command
+    finally:
+        platform_utils._alarm_dialog_command.cache_clear()
+
+    assert len(calls) == 1
+    assert calls[0][:3] == ["osacompile", "-o", command[1]]
+    assert command == ("osascript", command[1])
+    assert command[1].endswith(".scpt")
+
+
+def test_alarm_dialog_command_falls_back_without_osacompile(monkeypatch):
+    def fake_run(cmd, **kwargs):
+        raise FileNotFoundError(cmd[0])
+
+    monkeypatch.setattr(platform_utils.subprocess, "run", fake_run)
+    platform_utils._alarm_dialog_command.cache_clear()
+    try:
+        command = platform_utils._alarm_dialog_command()
+    finally:
+        platform_utils._alarm_dialog_command.cache_clear()
+
+    assert command == platform_utils._ALARM_DIALOG_COMMAND
+    assert command[:3] == ("osascript", "-e", "on run argv")
+
+
+def test_show_notification_macos_does_not_wait(monkeypatch):
+    started = []
+    monkeypatch.setattr(platform_utils.sys, "platform", "darwin")
+    monkeypatch.setattr(
+        platform_utils.subprocess, "Popen", lambda cmd, **kwargs: started.append(cmd)
+    )
+
+    platform_utils.show_notification('Drink "water"', "Reminder")
+
+    assert started[0][0] == "osascript"
+    assert started[0][-2:] == ['Drink "water"', "Reminder"]
@@ -1,7 +1,10 @@
 import runpy
 from datetime import time
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+import pytest
+
 from schedule_management.reminder_macos import (
     ScheduleConfig,
     WeeklySchedule,
@@ -18,6 +21,18 @@ def test_parse_time():
     assert t.minute == 30
 
 
+def test_parse_time_fast_path_matches_strptime():
+    """Direct parsing agrees with strptime on valid and invalid strings."""
+    from datetime import datetime
+
+    for value in ["00:00", "9:30", "09:5", "23:59"]:
+        assert parse_time(value) == datetime.strptime(value, "%H:%M").time()
+
+    for value in ["24:00", "12:60", "12", "12:", ":30", "1:2:3", "+1:30", " 9:30", "١٢:٣٠"]:
+        with pytest.raises(ValueError):
+            parse_time(value)
+
+
 def test_time_to_str():
     """Test time object to string conversion"""
     t = time(14, 5)
@@ -39,6 +54,63 @@ def test_add_minutes_to_time():
     # Exact hour
     result = add_minutes_to_time("10:00", 60)
     assert result == "11:00"
+    # Negative offsets wrap backwards
+    assert add_minutes_to_time("00:10", -20) == "23:50"
+    # Invalid input is rejected like strptime
+    for bad in ("9", "24:00", "ab:cd"):
+        with pytest.raises(ValueError):
+            add_minutes_to_time(bad, 5)
+
+
+def test_get_week_parity_uses_given_date():
+    """Week parity can be computed for a date the caller already holds."""
+    from datetime import date
+    from schedule_management import time_utils
+
+    with patch.object(time_utils, "datetime") as mock_datetime:
+        assert time_utils.get_week_parity(date(2026, 1, 5)) == "even"  # ISO week 2
+        assert time_utils.get_week_parity(date(2026, 1, 12)) == "odd"  # ISO week 3
+
+    mock_datetime.now.assert_not_called()
+
+
+def test_alarm_reuses_running_sound_and_stops_it_on_exit():
+    """The alarm should not respawn a still-playing sound and must stop it."""
+    from schedule_management import time_utils
+
+    player = MagicMock()
+    player.poll.return_value = None  # Still playing
+    sound_player = MagicMock(return_value=player)
+    dialog = MagicMock(side_effect=["OK", "OK", "停止闹铃"])
+
+    with patch.object(time_utils, "resolve_sound_player", return_value=sound_player), \
+            patch.object(time_utils, "resolve_dialog", return_value=dialog):
+        time_utils.alarm(
+            "t", "msg", "/mock/sound.aiff", 1, 300,
+            clock=lambda: 0.0, sleep=lambda _seconds: None,
+        )
+
+    assert dialog.call_count == 3
+    sound_player.assert_called_once_with("/mock/sound.aiff")
+    player.terminate.assert_called_once_with()
+
+
+def test_alarm_stops_after_max_duration():
+    """An undismissed alarm stops once the injected clock passes the limit."""
+    from schedule_management import time_utils
+
+    dialog = MagicMock(return_value="OK")
+    sleeps = []
+
+    with patch.object(time_utils, "resolve_sound_player", return_value=MagicMock()), \
+            patch.object(time_utils, "resolve_dialog", return_value=dialog):
+        time_utils.alarm(
+            "t", "msg", "/mock/sound.aiff", 5, 300,
+            clock=iter([0, 0, 350]).__next__, sleep=sleeps.append,
+        )
+
+    assert dialog.call_count == 2
+    assert sleeps == [5]
 
 
 def test_reminder_macos_runs_runner_main_when_executed_as_script():
@@ -70,7 +142,7 @@ class TestScheduleConfig:
     def test_should_skip_today_with_matching_day(self, mock_datetime):
         """Test should_skip_today when current day is in skip_days"""
         mock_now = MagicMock()
-        mock_now.strftime.return_value = "sunday"
+        mock_now.weekday.return_value = 6  # sunday
         mock_datetime.now.return_value = mock_now
 
         config = ScheduleConfig.__new__(ScheduleConfig)
@@ -81,7 +153,7 @@ class TestScheduleConfig:
     def test_should_skip_today_with_non_matching_day(self, mock_datetime):
         """Test should_skip_today when current day is not in skip_days"""
         mock_now = MagicMock()
-        mock_now.strftime.return_value = "monday"
+        mock_now.weekday.return_value = 0  # monday
         mock_datetime.now.return_value = mock_now
 
         config = ScheduleConfig.__new__(ScheduleConfig)
@@ -92,13 +164,39 @@ class TestScheduleConfig:
     def test_should_skip_today_with_multiple_skip_days(self, mock_datetime):
         """Test should_skip_today with multiple days in skip_days"""
         mock_now = MagicMock()
-        mock_now.strftime.return_value = "saturday"
+        mock_now.weekday.return_value = 5  # saturday
         mock_datetime.now.return_value = mock_now
 
         config = ScheduleConfig.__new__(ScheduleConfig)
         config.settings = {"skip_days": ["sunday", "saturday", "friday"]}
         assert config.should_skip_today()
 
+    def test_log_path_expands_home_variable(self, monkeypatch, tmp_path):
+        """$HOME in log_path should be expanded, not kept literally."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        config = ScheduleConfig.__new__(ScheduleConfig)
+        config.paths = {"log_path": "$HOME/task/tasks.log"}
+        assert config.log_path == tmp_path / "task" / "tasks.log"
+
+    def test_load_toml_file_reuses_parse_until_file_changes(self, tmp_path):
+        """Unchanged TOML files should be parsed once and reloaded on edit."""
+        import os
+        from schedule_management.reminder_macos import load_toml_file
+
+        settings_path = tmp_path / "settings.toml"
+        settings_path.write_text('[settings]\nsound_file = "a.aiff"\n', encoding="utf-8")
+
+        first = load_toml_file(str(settings_path))
+        assert load_toml_file(str(settings_path)) is first
+
+        settings_path.write_text('[settings]\nsound_file = "bb.aiff"\n', encoding="utf-8")
+        stat = settings_path.stat()
+        os.utime(settings_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        reloaded = load_toml_file(str(settings_path))
+        assert reloaded is not first
+        assert reloaded["settings"]["sound_file"] == "bb.aiff"
+
 
 class TestWeeklySchedule:
     """Test WeeklySchedule class functionality"""
@@ -115,12 +213,32 @@ class TestWeeklySchedule:
         assert weekly.get_schedule_for_parity("odd") == odd_data
         assert weekly.get_schedule_for_parity("even") == even_data
 
-    @patch("schedule_management.time_utils.get_week_parity")
+    def test_weekly_schedule_only_loads_requested_parity(self, tmp_path):
+        """Only the schedule file for the requested parity should be parsed."""
+        odd_path = tmp_path / "odd_weeks.toml"
+        odd_path.write_text('[common]\n"21:00" = "summary"\n', encoding="utf-8")
+        even_path = tmp_path / "even_weeks.toml"
+        even_path.write_text("not = [valid toml", encoding="utf-8")
+
+        weekly = WeeklySchedule(str(odd_path), str(even_path))
+
+        assert weekly.get_schedule_for_parity("odd") == {"common": {"21:00": "summary"}}
+        assert "even_data" not in vars(weekly)
+
+    def test_weekly_schedule_missing_file_fails_at_construction(self, tmp_path):
+        """A missing schedule file should still fail fast, not at the next week."""
+        odd_path = tmp_path / "odd_weeks.toml"
+        odd_path.write_text("[common]\n", encoding="utf-8")
+
+        with pytest.raises(FileNotFoundError):
+            WeeklySchedule(str(odd_path), str(tmp_path / "missing_even_weeks.toml"))
+
+    @patch("schedule_management.config.get_week_parity")
     @patch("schedule_management.config.datetime")
     def test_get_today_schedule_normal_day(self, mock_datetime, mock_parity):
         """Test get_today_schedule on a normal day"""
         mock_now = MagicMock()
-        mock_now.strftime.return_value = "monday"
+        mock_now.weekday.return_value = 0  # monday
         mock_datetime.now.return_value = mock_now
         mock_parity.return_value = "odd"
 
@@ -138,12 +256,12 @@ class TestWeeklySchedule:
         result = weekly.get_today_schedule(config)
         assert result == {"09:00": "pomodoro", "21:00": "summary_time"}
 
-    @patch("schedule_management.time_utils.get_week_parity")
+    @patch("schedule_management.config.get_week_parity")
     @patch("schedule_management.config.datetime")
     def test_get_today_schedule_skip_day(self, mock_datetime, mock_parity):
         """Test get_today_schedule returns empty on skip days"""
         mock_now = MagicMock()
-        mock_now.strftime.return_value = "sunday"
+        mock_now.weekday.return_value = 6  # sunday
         mock_datetime.now.return_value = mock_now
         mock_parity.return_value = "odd"
 
@@ -169,6 +287,7 @@ class TestScheduleRunner:
             "alarm_interval": 5,
             "max_alarm_duration": 300,
         }
+        self.config.tasks = {}
         self.config.time_blocks = {"pomodoro": 25, "break": 5}
         self.config.time_points = {
             "go_to_bed": "上床睡觉 😴 该休息了！",
@@ -186,6 +305,11 @@ class TestScheduleRunner:
         self.runner.config = self.config
         self.runner.notified_today = set()
         self.runner.pending_end_alarms = {}
+        self.runner._day_cache = None
+        self.runner._static_trigger_minutes = []
+        self.runner._end_alarm_minutes = []
+        self.runner._sleep = None
+        self.runner._reload_requested = False
         self.runner.weekly_schedule = MagicMock()
 
     @patch("schedule_management.runner.alarm")
@@ -233,6 +357,24 @@ class TestScheduleRunner:
             "Time point triggered at 21:00: 今天的工作结束 🎉, 总结一下"
         )
 
+    @patch("schedule_management.runner.show_notification")
+    @patch("schedule_management.runner.play_sound")
+    @patch("schedule_management.runner.alarm")
+    def test_time_point_uses_notification_when_configured(
+        self, mock_alarm, mock_play_sound, mock_notification
+    ):
+        """time_point_alert = 'notification' should skip the modal alarm."""
+        self.config.settings["time_point_alert"] = "notification"
+
+        self.runner._handle_event("21:00", "summary")
+
+        mock_alarm.assert_not_called()
+        mock_play_sound.assert_called_once_with("/mock/sound.aiff")
+        mock_notification.assert_called_once_with(
+            "今天的工作结束 🎉, 总结一下", _t("Reminder")
+        )
+        assert "21:00" in self.runner.notified_today
+
     @patch("schedule_management.runner.alarm")
     def test_handle_direct_message_event(self, mock_alarm):
         """测试直接消息字符串触发一次性提醒"""
@@ -262,6 +404,27 @@ class TestScheduleRunner:
         mock_alarm.assert_not_called()
         assert "10:00" not in self.runner.notified_today
 
+    @patch("schedule_management.runner.alarm")
+    def test_dispatch_fires_end_and_start_at_same_minute(self, mock_alarm):
+        """A block ending when the next one starts should trigger both alarms."""
+        self.runner.pending_end_alarms["09:10"] = "pomodoro finished"
+
+        self.runner._dispatch_due_events("09:10", self.today_schedule)
+
+        assert mock_alarm.call_count == 2
+        assert "09:10" not in self.runner.pending_end_alarms
+        assert "09:10" in self.runner.notified_today
+        assert "09:35" in self.runner.pending_end_alarms
+
+    @patch("schedule_management.runner.alarm")
+    def test_dispatch_skips_already_notified_start(self, mock_alarm):
+        """Start events already handled this minute are not repeated."""
+        self.runner.notified_today.add("08:30")
+
+        self.runner._dispatch_due_events("08:30", self.today_schedule)
+
+        mock_alarm.assert_not_called()
+
     @patch("schedule_management.runner.datetime")
     @patch("schedule_management.runner.alarm")
     def test_process_end_alarms(self, mock_alarm, mock_datetime):
@@ -307,6 +470,215 @@ class TestScheduleRunner:
         assert len(self.runner.notified_today) == 0
         assert len(self.runner.pending_end_alarms) == 0
 
+    @patch("schedule_management.runner.get_week_parity", return_value="odd")
+    def test_refresh_day_builds_schedule_once_per_date(self, _mock_parity):
+        """Today's base schedule is cached per date and reset on rollover."""
+        from datetime import date
+
+        self.runner.weekly_schedule.get_today_schedule.return_value = self.today_schedule
+        self.runner.notified_today.add("08:30")
+        self.runner.pending_end_alarms["08:55"] = "done"
+
+        first = self.runner._refresh_day(date(2026, 4, 8))
+        second = self.runner._refresh_day(date(2026, 4, 8))
+
+        assert first == second == (self.today_schedule, "odd", "wednesday", False)
+        assert self.runner.weekly_schedule.get_today_schedule.call_count == 1
+        assert "08:30" in self.runner.notified_today
+
+        self.runner._refresh_day(date(2026, 4, 9))
+
+        assert self.runner.weekly_schedule.get_today_schedule.call_count == 2
+        assert len(self.runner.notified_today) == 0
+        assert len(self.runner.pending_end_alarms) == 0
+
+    @patch("schedule_management.runner.get_week_parity", return_value="odd")
+    def test_refresh_day_skips_schedule_on_skip_days(self, _mock_parity):
+        """Skip days are evaluated once per date and yield an empty schedule."""
+        from datetime import date
+
+        with patch.object(
+            ScheduleConfig, "should_skip_today", return_value=True
+        ) as mock_skip:
+            result = self.runner._refresh_day(date(2026, 4, 8))
+            self.runner._refresh_day(date(2026, 4, 8))
+
+        assert result == ({}, "odd", "wednesday", True)
+        assert mock_skip.call_count == 1
+        self.runner.weekly_schedule.get_today_schedule.assert_not_called()
+
+    @patch("schedule_management.runner._log_runtime_event")
+    @patch("schedule_management.runner.get_week_parity", return_value="even")
+    def test_refresh_day_logs_schedule_load_errors(self, _mock_parity, mock_log):
+        """A broken week schedule is logged instead of crashing the runner."""
+        from datetime import date
+
+        self.runner.weekly_schedule.get_today_schedule.side_effect = FileNotFoundError(
+            "even_weeks.toml"
+        )
+
+        result = self.runner._refresh_day(date(2026, 4, 8))
+
+        assert result == ({}, "even", "wednesday", False)
+        mock_log.assert_called_once_with(
+            "Today's schedule could not be loaded: even_weeks.toml"
+        )
+
+    def test_seconds_until_next_check_targets_next_event(self):
+        """The loop should sleep until just after the next scheduled minute."""
+        from datetime import datetime
+
+        self.config.tasks = {"daily_summary": "22:00"}
+        now = datetime(2026, 4, 8, 8, 29, 30)
+
+        delay = self.runner._seconds_until_next_check(now, self.today_schedule)
+
+        assert delay == 31.0
+
+    def test_seconds_until_next_check_includes_pending_end_alarms(self):
+        """Pending end alarms should wake the loop before later events."""
+        from datetime import datetime
+
+        self.runner._queue_end_alarm("08:55", "done")
+        now = datetime(2026, 4, 8, 8, 54, 5)
+
+        delay = self.runner._seconds_until_next_check(now, self.today_schedule)
+
+        assert delay == 56.0
+
+    def test_static_trigger_minutes_are_sorted_and_unique(self):
+        """Fixed trigger times are indexed as sorted unique minutes of the day."""
+        self.config.tasks = {"daily_summary": "21:00", "daily_urgency": ["10:00"]}
+
+        index = self.runner._build_static_trigger_minutes(self.today_schedule)
+
+        assert index == [510, 550, 600, 1260]
+
+    @patch("schedule_management.runner.alarm")
+    def test_end_alarm_minutes_follow_pending_end_alarms(self, mock_alarm):
+        """Queued end alarms are indexed in order and dropped once fired."""
+        self.runner._handle_event("09:10", {"block": "pomodoro", "title": "写代码"})
+        self.runner._handle_event("08:30", "pomodoro")
+
+        assert self.runner._end_alarm_minutes == [535, 575]
+        assert self.runner._next_trigger_minute(531, {}) == 535
+
+        self.runner._dispatch_due_events("08:55", {})
+
+        assert self.runner._end_alarm_minutes == [575]
+        assert "08:55" not in self.runner.pending_end_alarms
+
+    @patch("schedule_management.runner.get_week_parity", return_value="odd")
+    def test_next_trigger_minute_includes_sync_only_slots(self, _mock_parity):
+        """Slots added by the sync overlay still wake the loop."""
+        from datetime import date
+
+        self.runner.weekly_schedule.get_today_schedule.return_value = {"10:00": "break"}
+        self.runner._refresh_day(date(2026, 4, 8))
+        overlay = {"10:00": "break", "09:45": "synced task"}
+
+        assert self.runner._next_trigger_minute(9 * 60, overlay) == 585
+
+    def test_seconds_until_next_check_is_capped(self):
+        """Long idle stretches should still re-read the wall clock every minute."""
+        from datetime import datetime
+        from schedule_management.runner import MAX_SLEEP_SECONDS
+
+        self.config.tasks = {"daily_summary": "22:00"}
+        now = datetime(2026, 4, 8, 12, 0, 0)
+
+        delay = self.runner._seconds_until_next_check(now, {})
+
+        assert delay == MAX_SLEEP_SECONDS == 60
+
+    @patch("schedule_management.runner.apply_synced_schedule")
+    @patch("schedule_management.runner.get_week_parity", return_value="odd")
+    @patch("schedule_management.runner.load_mode", return_value="j")
+    @patch("schedule_management.runner.alarm")
+    def test_run_fires_event_when_wake_lands_after_target(
+        self, mock_alarm, _mock_mode, _mock_parity, mock_apply_sync
+    ):
+        """A wake delayed past its target (suspend, DST) still fires the due event."""
+        from datetime import datetime
+
+        mock_apply_sync.side_effect = lambda schedule, **kwargs: dict(schedule)
+        self.runner.weekly_schedule.get_today_schedule.return_value = {
+            "09:00": "该喝水了"
+        }
+        wall_clock = [datetime(2026, 4, 8, 8, 10, 0)]
+        delays = []
+
+        def fake_sleep(seconds):
+            delays.append(seconds)
+            if len(delays) > 1:
+                raise KeyboardInterrupt
+            # The machine was suspended: the wall clock jumped past 09:00
+            wall_clock[0] = datetime(2026, 4, 8, 9, 0, 40)
+
+        self.runner._sleep = fake_sleep
+        with patch("schedule_management.runner.datetime") as mock_datetime:
+            mock_datetime.now.side_effect = lambda: wall_clock[0]
+            with pytest.raises(KeyboardInterrupt):
+                self.runner.run()
+
+        assert delays[0] <= 60
+        assert "09:00" in self.runner.notified_today
+        mock_alarm.assert_called_once()
+
+    def test_reload_configuration_reads_files_again(self, monkeypatch):
+        """A reload swaps in freshly parsed settings and clears the day cache."""
+        import schedule_management
+        import schedule_management.runner as runner_module
+
+        config_dir = Path(__file__).parent / "config" / "user_config_0"
+        monkeypatch.setattr(
+            runner_module, "SETTINGS_PATH", str(config_dir / "settings.toml")
+        )
+        monkeypatch.setattr(
+            schedule_management, "ODD_PATH", str(config_dir / "odd_weeks.toml")
+        )
+        monkeypatch.setattr(
+            schedule_management, "EVEN_PATH", str(config_dir / "even_weeks.toml")
+        )
+        self.runner._day_cache = (None, {}, "odd", "monday", False)
+        self.runner.request_reload()
+
+        self.runner._reload_configuration()
+
+        assert self.runner.config is not self.config
+        assert isinstance(self.runner.config, ScheduleConfig)
+        assert isinstance(self.runner.weekly_schedule, WeeklySchedule)
+        assert self.runner._day_cache is None
+        assert self.runner._reload_requested is False
+
+    def test_reload_configuration_keeps_old_config_on_error(self, monkeypatch):
+        """A broken settings path leaves the running configuration untouched."""
+        import schedule_management.runner as runner_module
+
+        monkeypatch.setattr(runner_module, "SETTINGS_PATH", "/nonexistent/settings.toml")
+        weekly = self.runner.weekly_schedule
+        self.runner.request_reload()
+
+        self.runner._reload_configuration()
+
+        assert self.runner.config is self.config
+        assert self.runner.weekly_schedule is weekly
+        assert self.runner._reload_requested is False
+
+    @patch("schedule_management.runner.load_mode", return_value="p")
+    def test_run_reloads_when_requested(self, _mock_mode):
+        """run() picks up a pending reload request at the start of a pass."""
+        self.runner.weekly_schedule.get_today_schedule.return_value = {}
+        self.runner._sleep = MagicMock(side_effect=KeyboardInterrupt)
+        self.runner.request_reload()
+
+        with patch.object(self.runner, "_reload_configuration") as mock_reload:
+            with pytest.raises(KeyboardInterrupt):
+                self.runner.run()
+
+        mock_reload.assert_called_once()
+        self.runner._sleep.assert_called_once()
+
 
 class TestFullFlow:
     """Test complete day flow with ScheduleRunner"""
@@ -578,10 +950,11 @@ class TestUrgentDeadlines:
         import json
         from datetime import datetime, timedelta
 
+        import schedule_management.data.loaders as data_loaders
         import schedule_management.runner as runner_module
 
         ddl_path = tmp_path / "ddl.json"
-        monkeypatch.setattr(runner_module, "DDL_PATH", str(ddl_path))
+        monkeypatch.setattr(data_loaders, "DDL_PATH", str(ddl_path))
 
         today = datetime.now().date()
         deadlines = [
@@ -604,10 +977,11 @@ class TestUrgentDeadlines:
         import json
         from datetime import datetime, timedelta
 
+        import schedule_management.data.loaders as data_loaders
         import schedule_management.runner as runner_module
 
         ddl_path = tmp_path / "ddl.json"
-        monkeypatch.setattr(runner_module, "DDL_PATH", str(ddl_path))
+        monkeypatch.setattr(data_loaders, "DDL_PATH", str(ddl_path))
 
         today = datetime.now().date()
         deadlines = [
@@ -637,10 +1011,11 @@ class TestUrgentDeadlines:
         import json
         from datetime import datetime
 
+        import schedule_management.data.loaders as data_loaders
         import schedule_management.runner as runner_module
 
         ddl_path = tmp_path / "ddl.json"
-        monkeypatch.setattr(runner_module, "DDL_PATH", str(ddl_path))
+        monkeypatch.setattr(data_loaders, "DDL_PATH", str(ddl_path))
 
         ddl_path.write_text(
             json.dumps(
@@ -658,10 +1033,11 @@ class TestUrgentDeadlines:
         runner._trigger_alarm.assert_called_once()
 
     def test_check_urgent_deadlines_noop_when_empty(self, tmp_path, monkeypatch):
+        import schedule_management.data.loaders as data_loaders
         import schedule_management.runner as runner_module
 
         ddl_path = tmp_path / "ddl.json"
-        monkeypatch.setattr(runner_module, "DDL_PATH", str(ddl_path))
+        monkeypatch.setattr(data_loaders, "DDL_PATH", str(ddl_path))
         ddl_path.write_text("[]", encoding="utf-8")
 
         runner = ScheduleRunner.__new__(ScheduleRunner)